@@ -1,86 +1,214 @@
+# PEP 810: on interpreters that support lazy imports, these load on first use.
+# None of these are used while jarvis itself is being imported; older Pythons ignore this.
+__lazy_modules__ = [
+    "tempfile", "concurrent.futures", "sqlite3", "random", "webbrowser", "argparse",
+    "difflib", "wave", "subprocess", "urllib.parse"
+]
+
 import sys
 import os
+import io
 import tempfile
 import threading
 import queue
+import collections
+import itertools
+import functools
+import concurrent.futures
 import time
 import logging
-from datetime import datetime
+from datetime import datetime, date
 import sqlite3
 import re
 import random
 import webbrowser
 import json
-import asyncio
-from pathlib import Path
+import argparse
+import hashlib
+import difflib
+import wave
+import importlib
+import importlib.util
+import subprocess
+from urllib.parse import quote, quote_plus
 from contextlib import contextmanager
 
-# Configure advanced logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('jarvis.log'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers are configured by setup_logging() when the app starts, not on import
 logger = logging.getLogger(__name__)
 
-# Check for required modules
-try:
-    import tkinter as tk
-    from tkinter import scrolledtext, messagebox, ttk
-except ImportError as e:
-    logger.error(f"Tkinter not available: {e}")
-    input("Press Enter to exit...")
-    sys.exit(1)
+def setup_logging():
+    """Configure advanced logging to jarvis.log and the console"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('jarvis.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+# Tkinter is imported by load_tkinter() when the GUI starts
+tk = scrolledtext = messagebox = ttk = None
+
+def load_tkinter():
+    """Import tkinter on first GUI use so non-GUI runs never load Tk"""
+    global tk, scrolledtext, messagebox, ttk
+    if tk is None:
+        import tkinter
+        from tkinter import scrolledtext, messagebox, ttk
+        tk = tkinter
+    return tk
 
 # Enhanced module detection with version checking
 MODULES = {
     'requests': {'available': False, 'version': None},
+    'requests_cache': {'available': False, 'version': None},
     'bs4': {'available': False, 'version': None},
+    'selectolax': {'available': False, 'version': None},
+    'lxml': {'available': False, 'version': None},
     'wikipedia': {'available': False, 'version': None},
     'speech_recognition': {'available': False, 'version': None},
     'pygame': {'available': False, 'version': None},
     'gtts': {'available': False, 'version': None},
+    'piper': {'available': False, 'version': None},
+    'pyttsx3': {'available': False, 'version': None},
     'ollama': {'available': False, 'version': None},
     'pydub': {'available': False, 'version': None},
-    'pyaudio': {'available': False, 'version': None}
+    'pyaudio': {'available': False, 'version': None},
+    'vosk': {'available': False, 'version': None},
+    'faster_whisper': {'available': False, 'version': None}
 }
 
+# Distribution names for modules whose PyPI package is named differently
+PACKAGE_NAMES = {
+    'bs4': 'beautifulsoup4',
+    'requests_cache': 'requests-cache',
+    'speech_recognition': 'SpeechRecognition',
+    'gtts': 'gTTS',
+    'piper': 'piper-tts',
+    'pyaudio': 'PyAudio',
+    'faster_whisper': 'faster-whisper'
+}
+
+class LazyModule:
+    """Stand-in for an optional module that performs the real import on first use"""
+    
+    def __init__(self, module_name, import_name):
+        self._module_name = module_name
+        self._import_name = import_name
+        self._module = None
+    
+    def _load(self):
+        """Import the wrapped module once"""
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._import_name)
+            except Exception as e:
+                logger.error(f"{self._module_name} failed to import: {e}")
+                MODULES[self._module_name]['available'] = False
+                raise
+        return self._module
+    
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+# Module availability from the previous run, reused while the interpreter and its paths are unchanged
+CAPS_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "jarvis", "caps.json")
+CAPS_CACHE_MAX_AGE = 7 * 24 * 3600
+
+def _caps_cache_key():
+    """Fingerprint of the interpreter and its import paths, including when they last changed"""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{sys.executable}\0{sys.version}".encode())
+    for index, entry in enumerate(sys.path):
+        # Installs show up as directory changes; the script's own directory churns, so skip it
+        try:
+            mtime = os.stat(entry).st_mtime_ns if index and entry else 0
+        except OSError:
+            mtime = 0
+        digest.update(f"\0{entry}\0{mtime}".encode())
+    return digest.hexdigest()
+
+def _load_caps_cache():
+    """Return {module_name: available} saved by a previous run, or {} if stale"""
+    try:
+        if time.time() - os.path.getmtime(CAPS_CACHE_PATH) > CAPS_CACHE_MAX_AGE:
+            return {}
+        with open(CAPS_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("key") == _CAPS_KEY:
+            return data["modules"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {}
+
+def _refresh_caps():
+    """Probe every optional module again and save the result for the next start"""
+    modules = {
+        module_name: importlib.util.find_spec(import_name) is not None
+        for module_name, import_name in _PROBED_MODULES.items()
+    }
+    try:
+        os.makedirs(os.path.dirname(CAPS_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{CAPS_CACHE_PATH}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": _CAPS_KEY, "modules": modules}, f)
+        os.replace(tmp_path, CAPS_CACHE_PATH)
+    except Exception as e:
+        logger.debug(f"Capability cache refresh failed: {e}")
+    return modules
+
+_CAPS_KEY = _caps_cache_key()
+_CAPS_CACHE = _load_caps_cache()
+_PROBED_MODULES = {}  # module_name -> import_name for everything check_module has seen
+
 def check_module(module_name, import_name=None):
-    """Enhanced module checking with version detection"""
+    """Check module availability without importing it"""
     if import_name is None:
         import_name = module_name
-    
-    try:
-        module = __import__(import_name)
-        MODULES[module_name]['available'] = True
-        if hasattr(module, '__version__'):
-            MODULES[module_name]['version'] = module.__version__
-        return module
-    except ImportError:
-        logger.warning(f"{module_name} not available")
+    _PROBED_MODULES[module_name] = import_name
+    
+    # find_spec only locates the module, so no library init code runs at startup;
+    # main() refreshes the cached answers in the background
+    available = _CAPS_CACHE.get(module_name)
+    if available is None:
+        available = importlib.util.find_spec(import_name) is not None
+    if not available:
+        logger.debug(f"{module_name} not available")  # main() logs the summary
         return None
+    
+    MODULES[module_name]['available'] = True
+    return LazyModule(module_name, import_name)
+
+def get_module_version(module_name):
+    """Look up an available module's installed version from package metadata"""
+    info = MODULES[module_name]
+    if info['available'] and info['version'] is None:
+        try:
+            from importlib import metadata
+            info['version'] = metadata.version(PACKAGE_NAMES.get(module_name, module_name))
+        except Exception:
+            pass
+    return info['version']
 
 # Initialize modules
-pygame = check_module('pygame')
-if pygame:
-    try:
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-        logger.info("Pygame mixer initialized")
-    except pygame.error as e:
-        logger.error(f"Pygame mixer init failed: {e}")
-        MODULES['pygame']['available'] = False
+pygame = check_module('pygame')  # Mixer is initialised on first speech by EnhancedTTS
 
 gtts_module = check_module('gtts')
-speech_recognition = check_module('speech_recognition')
+piper = check_module('piper')
+pyttsx3 = check_module('pyttsx3')
+sr = check_module('speech_recognition')
 requests = check_module('requests')
+requests_cache = check_module('requests_cache')
 bs4 = check_module('bs4')
+selectolax = check_module('selectolax')
+lxml = check_module('lxml')
 wikipedia = check_module('wikipedia')
 ollama = check_module('ollama')
 pydub = check_module('pydub')
 pyaudio = check_module('pyaudio')
+vosk = check_module('vosk')
+faster_whisper = check_module('faster_whisper')
 
 # Enhanced color palette
 COLORS = {
@@ -100,6 +228,64 @@ COLORS = {
     'system': '#ffa500'
 }
 
+# Chat history kept for scrolling back, and how much of it is rendered at once
+CHAT_LOG_SIZE = 2000
+CHAT_WINDOW_SIZE = 200
+
+DATABASE_PATH = os.path.join("data", "jarvis_enhanced.db")
+CONVERSATION_INSERT_SQL = (
+    "INSERT INTO conversations (timestamp, speaker, message, message_type, confidence, processing_time) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+HTTP_CACHE_PATH = os.path.join("data", "http_cache")  # requests-cache adds .sqlite
+
+# Local AI model. Unless JARVIS_OLLAMA_MODEL names one, the 4-bit q4_K_M instruct build
+# is used when it has been pulled, otherwise the plain llama3 tag (itself a 4-bit q4_0 build)
+OLLAMA_MODEL = os.environ.get('JARVIS_OLLAMA_MODEL')
+OLLAMA_PREFERRED_MODEL = 'llama3:8b-instruct-q4_K_M'
+OLLAMA_DEFAULT_MODEL = 'llama3'
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+WIKIPEDIA_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/{}"
+DUCKDUCKGO_URL = "https://api.duckduckgo.com/?q={}&format=json&no_html=1&skip_disambig=1"
+
+# Sites that can be opened by name
+WEBSITES = {
+    'google': 'https://www.google.com',
+    'youtube': 'https://www.youtube.com',
+    'facebook': 'https://www.facebook.com',
+    'twitter': 'https://www.twitter.com',
+    'x': 'https://www.x.com',
+    'github': 'https://www.github.com',
+    'wikipedia': 'https://www.wikipedia.org',
+    'amazon': 'https://www.amazon.com',
+    'netflix': 'https://www.netflix.com',
+    'reddit': 'https://www.reddit.com',
+    'stackoverflow': 'https://stackoverflow.com',
+    'gmail': 'https://mail.google.com',
+    'outlook': 'https://outlook.live.com',
+    'linkedin': 'https://www.linkedin.com'
+}
+WEBSITE_NAMES = tuple(WEBSITES)
+
+# Google SERP elements that hold a direct answer, matched in one pass
+ANSWER_SELECTOR = ', '.join([
+    '.hgKElc',  # Featured snippet
+    '.Z0LcW',   # Answer box
+    '.BNeawe.s3v9rd.AP7Wnd',  # Search result snippet
+    '.BNeawe.vvjwJb.AP7Wnd'   # Alternative snippet
+])
+
+# Piper voice models (<name>.onnx plus <name>.onnx.json) looked up in VOICES_DIR
+VOICES_DIR = os.path.join("data", "voices")
+PIPER_VOICES = {
+    ('en', 'co.uk'): 'en_GB-alan-medium',
+    ('en', 'com'): 'en_US-lessac-medium',
+    ('en', 'com.au'): 'en_GB-alan-medium',
+    ('en', 'ca'): 'en_US-lessac-medium'
+}
+TTS_MEMORY_CACHE_SIZE = 64  # Decoded sentences kept for instant replay of stock phrases
+
 FONTS = {
     'title': ('Segoe UI', 26, 'bold'),
     'heading': ('Segoe UI', 18, 'bold'),
@@ -109,6 +295,121 @@ FONTS = {
     'micro': ('Segoe UI', 8)
 }
 
+# Chat senders, interned so tag lookups compare by identity
+SENDER_JARVIS = sys.intern("JARVIS")
+SENDER_SYSTEM = sys.intern("SYSTEM")
+SENDER_YOU = sys.intern("YOU")
+SENDER_YOU_VOICE = sys.intern("YOU (Voice)")
+
+# Chat area text tags
+_MONO_BOLD = (FONTS['monospace'][0], FONTS['monospace'][1], 'bold')
+_MONO_ITALIC = (FONTS['monospace'][0], FONTS['monospace'][1], 'italic')
+CHAT_TAGS = {
+    # Timestamp tags
+    'timestamp': {'foreground': COLORS['text_secondary'], 'font': FONTS['micro']},
+    
+    # Speaker tags
+    'jarvis_sender': {'foreground': COLORS['accent'], 'font': _MONO_BOLD},
+    'thinking_sender': {'foreground': COLORS['ai_thinking'], 'font': _MONO_ITALIC},
+    'user_sender': {'foreground': COLORS['success'], 'font': _MONO_BOLD},
+    'voice_sender': {'foreground': COLORS['voice_active'], 'font': _MONO_BOLD},
+    'system_sender': {'foreground': COLORS['warning'], 'font': _MONO_BOLD},
+    
+    # Message content tags
+    'jarvis_message': {'foreground': COLORS['text_primary']},
+    'user_message': {'foreground': COLORS['text_primary']},
+    'system_message': {'foreground': COLORS['text_secondary']},
+    'error_message': {'foreground': COLORS['error']},
+    
+    # Special formatting
+    'highlight': {'background': COLORS['bg_light'], 'foreground': COLORS['accent']}
+}
+
+# TTS text cleanup: collapse "..."/"!!"/"??" and spell out common abbreviations
+_REPEATED_PUNCT_RE = re.compile(r'([.!?])\1+')
+_ABBREVIATIONS = {
+    'sir.': 'sir',
+    'Mr.': 'Mister',
+    'Mrs.': 'Missus',
+    'Dr.': 'Doctor',
+    'etc.': 'etcetera',
+    'e.g.': 'for example',
+    'i.e.': 'that is',
+    'vs.': 'versus'
+}
+_ABBREVIATION_RE = re.compile('|'.join(
+    re.escape(abbr) for abbr in sorted(_ABBREVIATIONS, key=len, reverse=True)
+))
+
+# Sentence boundaries for speaking text one sentence at a time
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Wake word spotting: vosk model for offline detection, regex for the Google fallback
+VOSK_MODEL_PATH = os.path.join("data", "vosk-model-small-en-us")
+WHISPER_MODEL = "small.en"  # Local faster-whisper model, run int8 on the CPU
+WHISPER_MAX_WARMUP = 1.5  # Seconds; a slower CPU is left on Google recognition
+WAKE_WORDS = ['jarvis', 'hey jarvis', 'okay jarvis']
+_WAKE_RE = re.compile(r'\b(?:hey\s+|okay\s+)?jarvis\b', re.IGNORECASE)
+
+# "weather in <place>" location extraction
+_WEATHER_LOCATION_RE = re.compile(r'\bin\s+(\w+(?:\s+\w+)*)', re.IGNORECASE)
+
+# Canned replies, used in turn from a shuffled cycle so none repeats back to back
+GREETING_RESPONSES = (
+    "{greeting}, sir. How may I assist you today?",
+    "{greeting}. What can I do for you, sir?",
+    "Hello, sir. {greeting}. How may I be of service?",
+    "{greeting}, sir. I'm ready to help with whatever you need."
+)
+THANKS_RESPONSES = (
+    "You're most welcome, sir.",
+    "Always a pleasure to assist, sir.",
+    "Happy to help, sir. Is there anything else?",
+    "At your service, sir.",
+    "My pleasure, sir. What else can I do for you?"
+)
+STATUS_RESPONSES = (
+    "All systems are functioning optimally, sir. I have {status}.",
+    "Operating at full capacity, sir. Currently running with {status}.",
+    "Systems are running smoothly, sir. {status_capitalized}.",
+)
+FALLBACK_RESPONSES = (
+    "I understand you're asking about that topic, sir. Perhaps try a web search for more detailed information?",
+    "That's an interesting question, sir. I'd recommend searching the web for comprehensive information on that subject.",
+    "I'd be happy to help you find information about that, sir. Shall I perform a web search?",
+    "For detailed information on that topic, sir, I suggest we search the web together.",
+)
+
+def _split_streamed_sentences(text):
+    """Split streamed text into sentences ready to speak and the text still pending
+    
+    The last finished sentence is held back, separator included, so the reply
+    always ends with a spoken part and later tokens join it with their spacing intact.
+    """
+    boundaries = [match.end() for match in _SENTENCE_END_RE.finditer(text)]
+    if boundaries and not text[boundaries[-1]:].strip():
+        boundaries.pop()
+    if not boundaries:
+        return [], text
+    
+    cut = boundaries[-1]
+    return [s for s in _SENTENCE_END_RE.split(text[:cut]) if s.strip()], text[cut:]
+
+def _time_greeting():
+    """Greeting for the current time of day"""
+    hour = time.localtime().tm_hour
+    if 5 <= hour < 12:
+        return "Good morning"
+    if 12 <= hour < 17:
+        return "Good afternoon"
+    return "Good evening"
+
+@functools.lru_cache(maxsize=1)
+def _date_strings(day_ordinal):
+    """Spoken forms of a date, without and with the year; formatted once per day"""
+    day = date.fromordinal(day_ordinal)
+    return day.strftime("%A, %B %d"), day.strftime("%A, %B %d, %Y")
+
 class AudioManager:
     """Advanced audio management for better TTS and speech recognition"""
     
@@ -134,52 +435,193 @@ class AudioManager:
         with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
             temp_path = tmp_file.name
         
-        self.temp_files.append(temp_path)
+        with self.audio_lock:
+            self.temp_files.append(temp_path)
         try:
             yield temp_path
         finally:
-            # File will be cleaned up by cleanup_temp_files
-            pass
+            # Release the file as soon as the caller is done with it
+            with self.audio_lock:
+                try:
+                    os.unlink(temp_path)
+                    self.temp_files.remove(temp_path)
+                except Exception as e:
+                    logger.debug(f"Deferred temp file cleanup for {temp_path}: {e}")
+
+class TTSCache:
+    """Persistent cache of synthesised speech so repeated phrases skip the network"""
+    
+    def __init__(self, db_path=DATABASE_PATH, max_entries=500):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        try:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS tts_cache (
+                    key TEXT PRIMARY KEY,
+                    mp3 BLOB,
+                    last_used REAL
+                )
+            ''')
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"TTS cache init error: {e}")
+            self.conn = None
+    
+    @staticmethod
+    def make_key(text, lang, tld, slow):
+        """Build the cache key for an utterance and its voice settings"""
+        return hashlib.sha1(f"{text}|{lang}|{tld}|{slow}".encode()).hexdigest()
+    
+    def get(self, key):
+        """Return cached MP3 bytes for key, or None on a miss"""
+        if not self.conn:
+            return None
+        
+        with self.lock:
+            try:
+                row = self.conn.execute("SELECT mp3 FROM tts_cache WHERE key=?", (key,)).fetchone()
+                if row is None:
+                    return None
+                self.conn.execute("UPDATE tts_cache SET last_used=? WHERE key=?", (time.time(), key))
+                self.conn.commit()
+                return row[0]
+            except Exception as e:
+                logger.warning(f"TTS cache read error: {e}")
+                return None
+    
+    def put(self, key, mp3):
+        """Store MP3 bytes under key, evicting least recently used entries"""
+        if not self.conn:
+            return
+        
+        with self.lock:
+            try:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO tts_cache (key, mp3, last_used) VALUES (?, ?, ?)",
+                    (key, sqlite3.Binary(mp3), time.time())
+                )
+                count = self.conn.execute("SELECT COUNT(*) FROM tts_cache").fetchone()[0]
+                if count > self.max_entries:
+                    self.conn.execute(
+                        "DELETE FROM tts_cache WHERE key IN "
+                        "(SELECT key FROM tts_cache ORDER BY last_used ASC LIMIT ?)",
+                        (count - self.max_entries,)
+                    )
+                self.conn.commit()
+            except Exception as e:
+                logger.warning(f"TTS cache write error: {e}")
+    
+    def close(self):
+        """Close the cache database connection"""
+        if self.conn:
+            with self.lock:
+                self.conn.close()
+                self.conn = None
 
 class EnhancedTTS:
     """Enhanced Text-to-Speech with improved voice quality and error handling"""
     
     def __init__(self):
-        self.available = MODULES['gtts']['available'] and MODULES['pygame']['available']
-        self.speaking = False
-        self.audio_manager = AudioManager()
         self.voice_settings = {
             'lang': 'en',
             'tld': 'co.uk',  # British accent
             'slow': False
         }
+        self.backend = self._select_backend()
+        self.available = self.backend is not None and MODULES['pygame']['available']
+        self.speaking = False
+        self.audio_manager = AudioManager()
+        # Only the hosted gTTS backend is slow enough to be worth caching
+        self.cache = TTSCache() if self.available and self.backend == 'gtts' else None
+        self._piper_voices = {}
+        self._pyttsx3_engine = None
+        self._sound_cache = collections.OrderedDict()  # Only touched by the synthesis worker
         self.speech_queue = queue.Queue()
+        self.sound_queue = queue.Queue(maxsize=2)  # Prefetched sentences ready to play
+        self._interrupt = threading.Event()
+        self._state_lock = threading.Lock()
+        self._state_changed = threading.Condition(self._state_lock)  # Wakes playback on new or stopped speech
+        self._generation = 0  # Bumped on interrupt so stale sentences are dropped
+        self._pending = 0  # Sentences queued but not yet handed to the mixer
+        self._on_complete = None  # Called once queued speech has finished
+        self._channel = None
+        self._play_until = 0.0  # Monotonic time the speech channel runs dry
+        self._mixer_inited = False
+        self._mixer_lock = threading.Lock()
         self.worker_thread = None
+        self.playback_thread = None
         self.stop_worker = False
         
         if self.available:
+            logger.info(f"TTS backend: {self.backend}")
             self.start_worker()
     
+    def _select_backend(self):
+        """Pick the speech engine: local piper, then pyttsx3, then hosted gTTS"""
+        if MODULES['piper']['available'] and self._piper_model_path() is not None:
+            return 'piper'
+        if MODULES['pyttsx3']['available']:
+            return 'pyttsx3'
+        if MODULES['gtts']['available']:
+            return 'gtts'
+        return None
+    
     def start_worker(self):
-        """Start the TTS worker thread"""
+        """Start the TTS synthesis and playback worker threads"""
         self.worker_thread = threading.Thread(target=self._speech_worker, daemon=True)
         self.worker_thread.start()
+        self.playback_thread = threading.Thread(target=self._playback_worker, daemon=True)
+        self.playback_thread.start()
     
     def _speech_worker(self):
-        """Worker thread for processing TTS requests"""
+        """Worker thread that synthesises queued sentences ahead of playback"""
         while not self.stop_worker:
             try:
-                text = self.speech_queue.get(timeout=1)
-                if text is None:  # Poison pill
+                item = self.speech_queue.get(timeout=1)
+                if item is None:  # Poison pill
+                    self.sound_queue.put(None)
                     break
-                self._speak_sync(text)
+                generation, text = item
+                if generation != self._generation:
+                    continue
+                
+                try:
+                    sound = self._synthesize(text)
+                except Exception as e:
+                    logger.error(f"TTS synthesis error: {e}")
+                    # Still pass a slot to playback so completion is reported in order
+                    sound = None
+                
+                self.sound_queue.put((generation, sound))
             except queue.Empty:
                 continue
             except Exception as e:
                 logger.error(f"TTS worker error: {e}")
     
-    def speak(self, text, interrupt=False):
-        """Queue text for speaking"""
+    def _playback_worker(self):
+        """Worker thread that plays synthesised sentences back to back"""
+        while not self.stop_worker:
+            try:
+                item = self.sound_queue.get(timeout=1)
+                if item is None:  # Poison pill
+                    break
+                generation, sound = item
+                if generation != self._generation:
+                    continue
+                self._play(sound, generation)
+            except queue.Empty:
+                continue
+            except Exception as e:
+                logger.error(f"TTS playback error: {e}")
+    
+    def speak(self, text, interrupt=False, on_complete=None):
+        """Queue text for speaking, one sentence at a time
+        
+        on_complete is called (from a worker thread) once everything queued has been spoken
+        or speech is stopped.
+        """
         if not text.strip() or not self.available:
             return
         
@@ -188,67 +630,233 @@ class EnhancedTTS:
             
         # Clean text for better TTS
         cleaned_text = self._clean_text(text)
-        self.speech_queue.put(cleaned_text)
+        
+        # Split into sentences so the first one plays while the rest synthesise
+        sentences = [s for s in _SENTENCE_END_RE.split(cleaned_text) if s.strip()]
+        with self._state_lock:
+            self._pending += len(sentences)
+            self.speaking = True
+            generation = self._generation
+            if on_complete is not None:
+                self._on_complete = on_complete
+            self._state_changed.notify_all()
+        self._interrupt.clear()
+        
+        for sentence in sentences:
+            self.speech_queue.put((generation, sentence))
     
     def _clean_text(self, text):
         """Clean text for better TTS pronunciation"""
-        # Remove excessive punctuation
-        text = re.sub(r'[.]{2,}', '.', text)
-        text = re.sub(r'[!]{2,}', '!', text)
-        text = re.sub(r'[?]{2,}', '?', text)
-        
-        # Replace common abbreviations with full words
-        replacements = {
-            'sir.': 'sir',
-            'Mr.': 'Mister',
-            'Mrs.': 'Missus',
-            'Dr.': 'Doctor',
-            'etc.': 'etcetera',
-            'e.g.': 'for example',
-            'i.e.': 'that is',
-            'vs.': 'versus'
-        }
-        
-        for abbr, full in replacements.items():
-            text = text.replace(abbr, full)
+        # Remove excessive punctuation, then expand abbreviations in one pass
+        text = _REPEATED_PUNCT_RE.sub(r'\1', text)
+        return _ABBREVIATION_RE.sub(lambda m: _ABBREVIATIONS[m.group(0)], text)
+    
+    def _mixer_frequency(self):
+        """Sample rate the active backend synthesises at"""
+        if self.backend == 'gtts':
+            return 24000  # gTTS MP3s are 24kHz
+        if self.backend == 'piper':
+            # Each voice declares its rate in the config next to the model
+            try:
+                with open(f"{self._piper_model_path()}.json", encoding='utf-8') as f:
+                    return int(json.load(f)['audio']['sample_rate'])
+            except Exception as e:
+                logger.debug(f"Piper voice sample rate unknown: {e}")
+        # Medium piper voices and the common system engines (espeak, SAPI5) use 22.05kHz
+        return 22050
+    
+    def _ensure_mixer(self):
+        """Initialise the pygame mixer on first use rather than at import"""
+        if self._mixer_inited:
+            return
         
-        return text
+        with self._mixer_lock:
+            if self._mixer_inited:
+                return
+            try:
+                # Mono at the backend's own rate, so sentences play without resampling/upmixing
+                pygame.mixer.init(frequency=self._mixer_frequency(), size=-16, channels=1, buffer=1024)
+                self._mixer_inited = True
+                logger.info("Pygame mixer initialized")
+            except pygame.error as e:
+                logger.error(f"Pygame mixer init failed: {e}")
+                MODULES['pygame']['available'] = False
+                self.available = False
+                raise
+    
+    def _synthesize(self, text):
+        """Get speech audio for text as a pygame Sound"""
+        self._ensure_mixer()
+        settings = self.voice_settings
+        key = TTSCache.make_key(text, settings['lang'], settings['tld'], settings['slow'])
+        
+        # Stock replies repeat often; reuse the decoded sound from memory
+        sound = self._sound_cache.get(key)
+        if sound is not None:
+            self._sound_cache.move_to_end(key)
+            return sound
+        
+        if self.backend == 'piper':
+            audio = self._synthesize_piper(text, settings)
+        elif self.backend == 'pyttsx3':
+            audio = self._synthesize_pyttsx3(text, settings)
+        else:
+            audio = self.cache.get(key) if self.cache else None
+            if audio is None:
+                audio = self._synthesize_mp3(text, settings)
+                if self.cache:
+                    self.cache.put(key, audio)
+        
+        sound = pygame.mixer.Sound(file=io.BytesIO(audio))
+        self._sound_cache[key] = sound
+        if len(self._sound_cache) > TTS_MEMORY_CACHE_SIZE:
+            self._sound_cache.popitem(last=False)
+        return sound
+    
+    def _piper_model_path(self, settings=None):
+        """Find the piper voice model for the voice settings, or any installed one"""
+        if settings is None:
+            settings = self.voice_settings
+        
+        preferred = PIPER_VOICES.get((settings['lang'], settings['tld']))
+        candidates = [preferred] if preferred else []
+        candidates += [name for name in PIPER_VOICES.values() if name != preferred]
+        
+        for name in candidates:
+            model_path = os.path.join(VOICES_DIR, f"{name}.onnx")
+            if os.path.exists(model_path):
+                return model_path
+        return None
     
-    def _speak_sync(self, text):
-        """Synchronous speech generation and playback"""
-        self.speaking = True
+    def _synthesize_piper(self, text, settings):
+        """Generate WAV bytes for text with a local piper voice"""
+        model_path = self._piper_model_path(settings)
+        voice = self._piper_voices.get(model_path)
+        if voice is None:
+            # Loading the model is the expensive part, so keep it around
+            voice = piper.PiperVoice.load(model_path)
+            self._piper_voices[model_path] = voice
+        
+        buf = io.BytesIO()
+        with wave.open(buf, 'wb') as wav_file:
+            if hasattr(voice, 'synthesize_wav'):
+                voice.synthesize_wav(text, wav_file)
+            else:
+                voice.synthesize(text, wav_file)
+        return buf.getvalue()
+    
+    def _synthesize_pyttsx3(self, text, settings):
+        """Generate WAV bytes for text with the platform speech engine"""
+        if self._pyttsx3_engine is None:
+            # Created on the synthesis worker, the only thread that uses it
+            self._pyttsx3_engine = pyttsx3.init()
+            if settings['tld'] == 'co.uk':
+                for voice in self._pyttsx3_engine.getProperty('voices'):
+                    if 'gb' in voice.id.lower() or 'british' in (voice.name or '').lower():
+                        self._pyttsx3_engine.setProperty('voice', voice.id)
+                        break
+        
+        with self.audio_manager.temp_audio_file(suffix='.wav') as temp_path:
+            self._pyttsx3_engine.save_to_file(text, temp_path)
+            self._pyttsx3_engine.runAndWait()
+            with open(temp_path, 'rb') as f:
+                return f.read()
+    
+    def _synthesize_mp3(self, text, settings):
+        """Generate MP3 bytes for text with gTTS"""
+        # Generate TTS audio straight into memory, no temp file round-trip
+        from gtts import gTTS
+        tts = gTTS(
+            text=text,
+            lang=settings['lang'],
+            tld=settings['tld'],
+            slow=settings['slow']
+        )
+        buf = io.BytesIO()
+        tts.write_to_fp(buf)
+        return buf.getvalue()
+    
+    def _get_channel(self):
+        """Get the mixer channel reserved for speech"""
+        if self._channel is None:
+            pygame.mixer.set_reserved(1)
+            self._channel = pygame.mixer.Channel(0)
+        return self._channel
+    
+    def _play(self, sound, generation):
+        """Hand a sentence to the speech channel, queueing it behind the current one"""
+        # A failed synthesis (sound is None) never touches the mixer, which may be the
+        # thing that failed; it only waits for whatever is already playing
+        channel = self._channel
+        starts = time.monotonic()
         try:
-            with self.audio_manager.temp_audio_file() as temp_path:
-                # Generate TTS audio
-                from gtts import gTTS
-                tts = gTTS(
-                    text=text,
-                    lang=self.voice_settings['lang'],
-                    tld=self.voice_settings['tld'],
-                    slow=self.voice_settings['slow']
-                )
-                tts.save(temp_path)
-                
-                # Load and play audio
-                pygame.mixer.music.load(temp_path)
-                pygame.mixer.music.play()
-                
-                # Wait for completion with interruption support
-                while pygame.mixer.music.get_busy() and self.speaking:
-                    pygame.time.wait(100)
-                    
+            if sound is not None:
+                channel = self._get_channel()
+                if channel.get_busy():
+                    # Gapless handoff: pygame starts it as soon as the current sentence ends
+                    channel.queue(sound)
+                    starts = max(starts, self._play_until)
+                else:
+                    channel.play(sound)
+                self._play_until = starts + sound.get_length()
         except Exception as e:
-            logger.error(f"TTS synthesis error: {e}")
-        finally:
+            logger.error(f"TTS playback error: {e}")
+        self._sentence_done(generation)
+        
+        if channel is not None:
+            # Only one sound can wait in the channel queue, so hold the next one back.
+            # Sleep until it is due to start rather than polling the mixer.
+            while channel.get_queue() is not None and not self._interrupt.is_set():
+                self._interrupt.wait(max(starts - time.monotonic(), 0.02))
+            
+            # Last sentence handed over: sleep until it ends, waking early if more
+            # speech is queued or speech is stopped
+            with self._state_lock:
+                while channel.get_busy() and not self._interrupt.is_set() and self._pending == 0:
+                    self._state_changed.wait(max(self._play_until - time.monotonic(), 0.02))
+        self._finish_speaking()
+    
+    def _finish_speaking(self):
+        """Mark speech as finished and run the completion callback, if any"""
+        with self._state_lock:
+            if self._pending or not self.speaking:
+                return
             self.speaking = False
+            callback, self._on_complete = self._on_complete, None
+        
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"TTS completion callback error: {e}")
+    
+    def _sentence_done(self, generation):
+        """Mark one queued sentence as handled"""
+        with self._state_lock:
+            if generation == self._generation and self._pending > 0:
+                self._pending -= 1
     
     def stop_speaking(self):
-        """Stop current speech"""
-        self.speaking = False
-        try:
-            pygame.mixer.music.stop()
-        except:
-            pass
+        """Stop current speech and drop any queued sentences"""
+        with self._state_lock:
+            self._generation += 1
+            self._pending = 0
+            self._interrupt.set()
+            self._state_changed.notify_all()
+        self._finish_speaking()
+        
+        for pending_queue in (self.speech_queue, self.sound_queue):
+            try:
+                while True:
+                    pending_queue.get_nowait()
+            except queue.Empty:
+                pass
+        
+        if self._mixer_inited:
+            try:
+                pygame.mixer.stop()
+            except:
+                pass
     
     def is_speaking(self):
         """Check if currently speaking"""
@@ -264,6 +872,10 @@ class EnhancedTTS:
         if self.worker_thread:
             self.speech_queue.put(None)  # Poison pill
             self.worker_thread.join(timeout=1)
+        if self.playback_thread:
+            self.playback_thread.join(timeout=1)
+        if self.cache:
+            self.cache.close()
         self.audio_manager.cleanup_temp_files()
 
 class EnhancedSpeechRecognizer:
@@ -275,6 +887,10 @@ class EnhancedSpeechRecognizer:
         self.microphone = None
         self.listening = False
         self.calibrated = False
+        self.wake_word_spotter = None
+        self._source = None  # Microphone stream, kept open once started
+        self._whisper = None  # Local transcription model once load_whisper succeeds, False if unusable
+        self._mic_lock = threading.RLock()
         
         if self.available:
             self._initialize_recognizer()
@@ -282,10 +898,9 @@ class EnhancedSpeechRecognizer:
     def _initialize_recognizer(self):
         """Initialize speech recognizer with optimal settings"""
         try:
-            import speech_recognition as sr
-            
             self.recognizer = sr.Recognizer()
             self.microphone = sr.Microphone()
+            self._recognize_google = self.recognizer.recognize_google
             
             # Enhanced recognizer settings
             self.recognizer.energy_threshold = 300  # Lower threshold for better sensitivity
@@ -295,19 +910,45 @@ class EnhancedSpeechRecognizer:
             self.recognizer.pause_threshold = 0.8  # Shorter pause for responsiveness
             self.recognizer.operation_timeout = None
             
+            self._initialize_wake_word_spotter()
+            
             logger.info("Enhanced speech recognition initialized")
         except Exception as e:
             logger.error(f"Speech recognition init error: {e}")
             self.available = False
     
+    @contextmanager
+    def _microphone_source(self):
+        """Use the shared microphone stream, opening it on first use"""
+        with self._mic_lock:
+            if self._source is None:
+                self._source = self.microphone.__enter__()
+            yield self._source
+    
+    def close(self):
+        """Close the shared microphone stream, unless it is still being recorded from"""
+        # A listen or calibration can hold the lock for seconds; never block shutdown on it.
+        # A stream still in use is released when the process exits.
+        if not self._mic_lock.acquire(blocking=False):
+            logger.debug("Microphone busy at shutdown, leaving the stream to process exit")
+            return
+        try:
+            if self._source is not None:
+                try:
+                    self.microphone.__exit__(None, None, None)
+                except Exception as e:
+                    logger.debug(f"Microphone close error: {e}")
+                self._source = None
+        finally:
+            self._mic_lock.release()
+    
     def calibrate(self):
         """Calibrate microphone for ambient noise"""
         if not self.available:
             return False
         
         try:
-            import speech_recognition as sr
-            with self.microphone as source:
+            with self._microphone_source() as source:
                 logger.info("Calibrating microphone for ambient noise...")
                 self.recognizer.adjust_for_ambient_noise(source, duration=2)
                 self.calibrated = True
@@ -317,27 +958,54 @@ class EnhancedSpeechRecognizer:
             logger.error(f"Microphone calibration error: {e}")
             return False
     
+    def _initialize_wake_word_spotter(self):
+        """Load the offline vosk keyword spotter if a model is installed"""
+        if not MODULES['vosk']['available'] or not os.path.isdir(VOSK_MODEL_PATH):
+            return
+        
+        try:
+            vosk.SetLogLevel(-1)
+            model = vosk.Model(VOSK_MODEL_PATH)
+            grammar = json.dumps(WAKE_WORDS + ['[unk]'])
+            self.wake_word_spotter = vosk.KaldiRecognizer(model, 16000, grammar)
+            logger.info("Offline wake word spotting enabled")
+        except Exception as e:
+            logger.warning(f"Wake word spotter init error: {e}")
+    
     def listen_for_wake_word(self, wake_words=None):
         """Listen for wake words (always listening mode)"""
         if wake_words is None:
-            wake_words = ['jarvis', 'hey jarvis', 'okay jarvis']
+            wake_pattern = _WAKE_RE
+        else:
+            wake_pattern = re.compile(
+                r'\b(?:' + '|'.join(re.escape(w) for w in wake_words) + r')\b', re.IGNORECASE
+            )
         
         if not self.available:
             return None
         
         try:
-            import speech_recognition as sr
-            with self.microphone as source:
+            with self._microphone_source() as source:
                 logger.debug("Listening for wake word...")
                 audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=3)
             
-            text = self.recognizer.recognize_google(audio).lower()
-            
-            for wake_word in wake_words:
-                if wake_word in text:
-                    return text
+            if self.wake_word_spotter is not None:
+                # Spot the wake word offline and only go to Google once it fires
+                self.wake_word_spotter.AcceptWaveform(
+                    audio.get_raw_data(convert_rate=16000, convert_width=2)
+                )
+                spotted = json.loads(self.wake_word_spotter.FinalResult()).get('text', '')
+                self.wake_word_spotter.Reset()
+                if not wake_pattern.search(spotted):
+                    return None
+                
+                try:
+                    return self._recognize_google(audio).lower()
+                except (sr.UnknownValueError, sr.RequestError):
+                    return spotted
             
-            return None
+            text = self._recognize_google(audio).lower()
+            return text if wake_pattern.search(text) else None
             
         except sr.WaitTimeoutError:
             return None
@@ -356,9 +1024,7 @@ class EnhancedSpeechRecognizer:
             self.calibrate()
         
         try:
-            import speech_recognition as sr
-            
-            with self.microphone as source:
+            with self._microphone_source() as source:
                 logger.debug(f"Listening with timeout={timeout}, phrase_limit={phrase_limit}")
                 audio = self.recognizer.listen(
                     source, 
@@ -387,21 +1053,29 @@ class EnhancedSpeechRecognizer:
     
     def _recognize_with_fallback(self, audio):
         """Try multiple recognition engines for better accuracy"""
-        import speech_recognition as sr
+        # All engines work on 16kHz 16-bit audio, so resample once and upload less
+        if audio.sample_rate != 16000 or audio.sample_width != 2:
+            audio = sr.AudioData(audio.get_raw_data(convert_rate=16000, convert_width=2), 16000, 2)
+        
+        # Local whisper first when installed: no upload and no network round trip
+        text = self._recognize_whisper(audio)
+        if text:
+            return text
         
         # Primary: Google (most accurate)
         try:
-            return self.recognizer.recognize_google(audio)
+            return self._recognize_google(audio)
         except sr.UnknownValueError:
             pass
         except sr.RequestError as e:
             logger.warning(f"Google recognition service error: {e}")
         
-        # Fallback: Google with alternative API key (if available)
-        try:
-            return self.recognizer.recognize_google_cloud(audio)
-        except:
-            pass
+        # Fallback: Google Cloud, only when credentials are configured
+        if os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'):
+            try:
+                return self.recognizer.recognize_google_cloud(audio)
+            except:
+                pass
         
         # Last resort: Sphinx (offline, less accurate but always available)
         try:
@@ -411,21 +1085,72 @@ class EnhancedSpeechRecognizer:
         
         return None
     
+    def load_whisper(self):
+        """Load the local whisper model and check this CPU runs it fast enough
+        
+        Blocks while the model loads (and downloads, the first time). Returns True
+        if whisper will be used; until then recognition goes to Google.
+        """
+        if not self.available or not MODULES['faster_whisper']['available'] or self._whisper is not None:
+            return bool(self._whisper)
+        
+        try:
+            logger.info(f"Loading whisper model {WHISPER_MODEL}...")
+            model = faster_whisper.WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
+            
+            # Whisper pads every clip to a 30s window, so a second of silence
+            # measures the fixed cost each command would pay
+            buf = io.BytesIO()
+            with wave.open(buf, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(16000)
+                wav_file.writeframes(b'\0\0' * 16000)
+            buf.seek(0)
+            start = time.monotonic()
+            segments, _ = model.transcribe(buf, language="en", beam_size=1)
+            list(segments)
+            elapsed = time.monotonic() - start
+        except Exception as e:
+            logger.warning(f"Whisper model load error: {e}")
+            self._whisper = False
+            return False
+        
+        if elapsed > WHISPER_MAX_WARMUP:
+            logger.info(f"Whisper took {elapsed:.1f}s on a warm-up clip; keeping Google recognition")
+            self._whisper = False
+            return False
+        
+        self._whisper = model
+        return True
+    
+    def _recognize_whisper(self, audio):
+        """Transcribe with the local faster-whisper model, or None if it is not ready"""
+        if not self._whisper:
+            return None
+        
+        try:
+            segments, _ = self._whisper.transcribe(
+                io.BytesIO(audio.get_wav_data()), language="en", beam_size=1
+            )
+            return "".join(segment.text for segment in segments).strip() or None
+        except Exception as e:
+            logger.warning(f"Whisper recognition error: {e}")
+            return None
+    
     def test_microphone(self):
         """Test microphone functionality"""
         if not self.available:
             return False, "Speech recognition not available"
         
         try:
-            import speech_recognition as sr
-            
             # Test microphone list
             mics = sr.Microphone.list_microphone_names()
             if not mics:
                 return False, "No microphones detected"
             
             # Test recording
-            with self.microphone as source:
+            with self._microphone_source() as source:
                 audio = self.recognizer.listen(source, timeout=2, phrase_time_limit=2)
             
             if len(audio.get_raw_data()) == 0:
@@ -436,6 +1161,36 @@ class EnhancedSpeechRecognizer:
         except Exception as e:
             return False, f"Microphone test failed: {e}"
 
+class ResultCache:
+    """Thread-safe in-memory cache with a size bound and per-entry expiry"""
+    
+    def __init__(self, maxsize=256, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if time.monotonic() >= expires:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entries"""
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
 class SmartCommandProcessor:
     """Enhanced command processing with better pattern matching and context awareness"""
     
@@ -476,22 +1231,51 @@ class SmartCommandProcessor:
             ]
         }
         
-        # Compile regex patterns for better performance
-        self.compiled_patterns = {}
-        for command, patterns in self.command_patterns.items():
-            self.compiled_patterns[command] = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        # Compile regex patterns for better performance, flattened in table order;
+        # the first pattern that matches decides the command
+        self.compiled_patterns = [
+            (command, re.compile(pattern, re.IGNORECASE))
+            for command, patterns in self.command_patterns.items()
+            for pattern in patterns
+        ]
+        
+        # Common query prefixes, tried in order, for search text without captured groups
+        prefixes = [
+            'search for', 'look up', 'find information about', 'tell me about',
+            'what is', 'who is', 'where is', 'when is', 'how is',
+            'define', 'explain', 'describe'
+        ]
+        self.search_prefix_pattern = re.compile(
+            '^(?:' + '|'.join(re.escape(prefix) for prefix in prefixes) + ')', re.IGNORECASE
+        )
+        
+        # The most common commands are short fixed phrases; classify them once here
+        # so they are a dict lookup instead of a scan of the patterns
+        exact_commands = [
+            'time', 'what time is it', "what's the time", 'date', "what's the date",
+            "what's today's date", 'weather', 'hello', 'hi', 'hey', 'good morning',
+            'good afternoon', 'good evening', 'thanks', 'thank you', 'how are you',
+            'status', 'clear screen'
+        ]
+        self.exact_commands = {text: self._match_command(text) for text in exact_commands}
     
     def classify_command(self, text):
         """Classify command using pattern matching"""
         text = text.strip().lower()
         
-        for command, patterns in self.compiled_patterns.items():
-            for pattern in patterns:
-                match = pattern.search(text)
-                if match:
-                    # Extract relevant parts from the match
-                    groups = match.groups()
-                    return command, groups if groups else None
+        exact = self.exact_commands.get(text)
+        if exact is not None:
+            return exact
+        return self._match_command(text)
+    
+    def _match_command(self, text):
+        """Classify normalised text with the command patterns, in table order"""
+        for command, pattern in self.compiled_patterns:
+            match = pattern.search(text)
+            if match:
+                # Extract relevant parts from the match
+                groups = match.groups()
+                return command, groups if groups else None
         
         # If no pattern matches, treat as a general query
         return 'general', text
@@ -503,16 +1287,9 @@ class SmartCommandProcessor:
             return groups[-1].strip()
         
         # Fallback: remove common prefixes
-        prefixes = [
-            'search for', 'look up', 'find information about', 'tell me about',
-            'what is', 'who is', 'where is', 'when is', 'how is',
-            'define', 'explain', 'describe'
-        ]
-        
-        text_lower = text.lower()
-        for prefix in prefixes:
-            if text_lower.startswith(prefix):
-                return text[len(prefix):].strip()
+        match = self.search_prefix_pattern.match(text)
+        if match:
+            return text[match.end():].strip()
         
         return text
 
@@ -520,81 +1297,116 @@ class EnhancedWebAccess:
     """Enhanced web access with better search capabilities and caching"""
     
     def __init__(self):
-        self.available = MODULES['requests']['available'] and MODULES['bs4']['available']
+        # Wikipedia and DuckDuckGo answer in JSON; an HTML parser only enables the Google fallback
+        self.available = MODULES['requests']['available']
+        self.html_parser_available = MODULES['selectolax']['available'] or MODULES['bs4']['available']
         self.wikipedia_available = MODULES['wikipedia']['available']
-        self.cache = {}
         self.cache_timeout = 300  # 5 minutes
-        
-        if self.wikipedia_available:
-            wikipedia.set_lang("en")
+        self.cache = ResultCache(maxsize=256, ttl=self.cache_timeout)
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._wikipedia_configured = False  # set_lang imports wikipedia, so do it on first search
+        # Searches run off the Tk thread; the racing lookups get their own pool so a
+        # search waiting on them can never starve the pool it is running on
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='jarvis-io')
+        self._web_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='jarvis-web')
+    
+    def get_session(self):
+        """Get the shared HTTP session, persistently cached when requests-cache is installed"""
+        with self._session_lock:
+            if self._session is None:
+                if MODULES['requests_cache']['available']:
+                    os.makedirs(os.path.dirname(HTTP_CACHE_PATH), exist_ok=True)
+                    self._session = requests_cache.CachedSession(
+                        HTTP_CACHE_PATH,
+                        backend='sqlite',
+                        expire_after=self.cache_timeout,
+                        allowable_codes=(200,)
+                    )
+                else:
+                    self._session = requests.Session()
+                # One keep-alive session for every lookup, so only the first pays for TLS setup;
+                # the pool fits each concurrent search leg (Wikipedia, DuckDuckGo, Google)
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                self._session.mount('https://', adapter)
+                self._session.headers['User-Agent'] = USER_AGENT
+            return self._session
     
     def search_web(self, query):
         """Enhanced web search with caching and multiple sources"""
         # Check cache first
         cache_key = query.lower()
-        if cache_key in self.cache:
-            result, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_timeout:
-                return result
+        result = self.cache.get(cache_key)
+        if result is not None:
+            return result
         
         result = self._search_web_uncached(query)
         
         # Cache the result
-        self.cache[cache_key] = (result, time.time())
+        self.cache.put(cache_key, result)
         return result
     
+    def search_web_async(self, query, callback):
+        """Run search_web on the I/O pool and pass the result to callback on that thread"""
+        def on_done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Web search error: {e}")
+                result = "I encountered an error while searching for information."
+            callback(result)
+        
+        future = self._executor.submit(self.search_web, query)
+        future.add_done_callback(on_done)
+        return future
+    
     def _search_web_uncached(self, query):
         """Perform actual web search"""
         if not self.available:
-            return "Web access is not available. Please install requests and beautifulsoup4."
-        
-        # Try Wikipedia first for factual information
-        if self.wikipedia_available:
-            try:
-                # Use Wikipedia's search to find the best match
-                search_results = wikipedia.search(query, results=3)
-                if search_results:
-                    try:
-                        summary = wikipedia.summary(search_results[0], sentences=3)
-                        return f"According to Wikipedia: {summary}"
-                    except wikipedia.exceptions.DisambiguationError as e:
-                        # Try the first disambiguation option
-                        try:
-                            summary = wikipedia.summary(e.options[0], sentences=3)
-                            return f"According to Wikipedia: {summary}"
-                        except:
-                            pass
-                    except wikipedia.exceptions.PageError:
-                        pass
-            except Exception as e:
-                logger.debug(f"Wikipedia search failed: {e}")
+            return "Web access is not available. Please install requests."
         
-        # Fallback to general web search
+        # Race Wikipedia against the DuckDuckGo Instant Answer API; the first
+        # non-empty answer wins, so a slow or missing source costs nothing
+        sources = {
+            self._web_executor.submit(self._search_wikipedia, query): "According to Wikipedia",
+            self._web_executor.submit(self._search_duckduckgo, query): "According to web sources",
+        }
+        for future in concurrent.futures.as_completed(sources):
+            answer = future.result()
+            if answer:
+                for other in sources:
+                    other.cancel()
+                return f"{sources[future]}: {answer}"
+        
+        # Neither had an answer; scraping Google needs an HTML parser
+        if self.html_parser_available:
+            return self._search_google(query)
+        return "I found some information about that topic, but couldn't extract a clear answer."
+    
+    def _search_duckduckgo(self, query):
+        """Ask the DuckDuckGo Instant Answer API; a small JSON reply, nothing to parse"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            
-            search_url = f"https://www.google.com/search?q={requests.utils.quote(query)}"
-            response = requests.get(search_url, headers=headers, timeout=10)
-            
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Try to extract featured snippet or answer box
-            answer_selectors = [
-                '.hgKElc',  # Featured snippet
-                '.Z0LcW',   # Answer box
-                '.BNeawe.s3v9rd.AP7Wnd',  # Search result snippet
-                '.BNeawe.vvjwJb.AP7Wnd'   # Alternative snippet
-            ]
+            response = self.get_session().get(DUCKDUCKGO_URL.format(quote_plus(query)), timeout=5)
+            response.raise_for_status()
+            data = response.json()
+            for field in ('Answer', 'AbstractText', 'Definition'):
+                text = data.get(field)
+                if isinstance(text, str) and len(text.strip()) > 10:
+                    return text.strip()
+        except Exception as e:
+            logger.debug(f"DuckDuckGo search failed: {e}")
+        return None
+    
+    def _search_google(self, query):
+        """Search Google and extract an answer snippet"""
+        try:
+            # hl/num keep the results page small: English, three results
+            search_url = f"https://www.google.com/search?q={quote_plus(query)}&hl=en&num=3"
+            response = self.get_session().get(search_url, timeout=5)
             
-            for selector in answer_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text().strip()
-                    if text and len(text) > 10:  # Minimum meaningful length
-                        return f"According to web sources: {text}"
+            text = self._extract_answer(response.text)
+            if text:
+                return f"According to web sources: {text}"
             
             return "I found some information about that topic, but couldn't extract a clear answer."
             
@@ -605,43 +1417,111 @@ class EnhancedWebAccess:
             logger.error(f"Web search error: {e}")
             return "I encountered an error while searching for information."
     
+    def _search_wikipedia(self, query):
+        """Find a Wikipedia summary with the REST API, one request per candidate title"""
+        try:
+            page = self._wikipedia_summary(query)
+            if page is None or page.get('type') == 'disambiguation':
+                # Not an unambiguous title, so try the closest search matches instead
+                page = None
+                for title in self._wikipedia_titles(query):
+                    candidate = self._wikipedia_summary(title)
+                    if candidate is not None and candidate.get('type') != 'disambiguation':
+                        page = candidate
+                        break
+            
+            if page:
+                return page.get('extract')
+        except Exception as e:
+            logger.debug(f"Wikipedia search failed: {e}")
+        return None
+    
+    def _wikipedia_summary(self, title):
+        """Fetch the REST summary for a page title, or None if there is no such page"""
+        url = WIKIPEDIA_SUMMARY_URL.format(quote(title.replace(' ', '_'), safe=''))
+        response = self.get_session().get(url, timeout=5)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+    
+    def _wikipedia_titles(self, query):
+        """Search Wikipedia for page titles matching a free-form query"""
+        if not self.wikipedia_available:
+            return []
+        
+        if not self._wikipedia_configured:
+            wikipedia.set_lang("en")
+            self._wikipedia_configured = True
+        return wikipedia.search(query, results=3)
+    
+    def _extract_answer(self, html):
+        """Pull the first meaningful answer snippet out of a Google results page"""
+        if MODULES['selectolax']['available']:
+            from selectolax.parser import HTMLParser
+            texts = (node.text().strip() for node in HTMLParser(html).css(ANSWER_SELECTOR))
+        else:
+            from bs4 import BeautifulSoup
+            parser = 'lxml' if MODULES['lxml']['available'] else 'html.parser'
+            soup = BeautifulSoup(html, parser)
+            texts = (element.get_text().strip() for element in soup.select(ANSWER_SELECTOR))
+        
+        for text in texts:
+            if text and len(text) > 10:  # Minimum meaningful length
+                return text
+        return None
+    
+    def close(self):
+        """Stop the search pools and release the HTTP session"""
+        self._executor.shutdown(wait=False)
+        self._web_executor.shutdown(wait=False)
+        if self._session is not None:
+            self._session.close()
+    
     def open_website(self, site_name):
         """Enhanced website opening with more sites"""
-        sites = {
-            'google': 'https://www.google.com',
-            'youtube': 'https://www.youtube.com',
-            'facebook': 'https://www.facebook.com',
-            'twitter': 'https://www.twitter.com',
-            'x': 'https://www.x.com',
-            'github': 'https://www.github.com',
-            'wikipedia': 'https://www.wikipedia.org',
-            'amazon': 'https://www.amazon.com',
-            'netflix': 'https://www.netflix.com',
-            'reddit': 'https://www.reddit.com',
-            'stackoverflow': 'https://stackoverflow.com',
-            'gmail': 'https://mail.google.com',
-            'outlook': 'https://outlook.live.com',
-            'linkedin': 'https://www.linkedin.com'
-        }
-        
         site_lower = site_name.lower().strip()
         
-        if site_lower in sites:
-            webbrowser.open(sites[site_lower])
+        if site_lower in WEBSITES:
+            webbrowser.open(WEBSITES[site_lower])
             return f"Opening {site_name.capitalize()} for you, sir."
         elif site_lower.startswith('http'):
             webbrowser.open(site_lower)
             return f"Opening {site_name} for you, sir."
-        else:
-            # Try to construct a URL
-            url = f"https://www.{site_lower}.com"
-            webbrowser.open(url)
-            return f"Attempting to open {site_name}, sir."
+        
+        # Catch near misses like "yutube" before guessing a domain
+        close_matches = difflib.get_close_matches(site_lower, WEBSITE_NAMES, n=1, cutoff=0.75)
+        if close_matches:
+            match = close_matches[0]
+            webbrowser.open(WEBSITES[match])
+            return f"Opening {match.capitalize()} for you, sir."
+        
+        # Try to construct a URL
+        url = f"https://www.{site_lower}.com"
+        webbrowser.open(url)
+        return f"Attempting to open {site_name}, sir."
 
 class EnhancedJarvisAssistant:
     """Enhanced JARVIS with improved speech, better UI, and smarter responses"""
     
+    # Chat tags per sender: (sender_tag, message_tag)
+    _TAG_TABLE = {
+        SENDER_JARVIS: ("jarvis_sender", "jarvis_message"),
+        SENDER_SYSTEM: ("system_sender", "system_message"),
+        SENDER_YOU: ("user_sender", "user_message"),
+        SENDER_YOU_VOICE: ("voice_sender", "user_message"),
+    }
+    _DEFAULT_TAGS = ("system_sender", "system_message")
+    
+    _AI_SYSTEM_PROMPT = (
+        "You are JARVIS, an advanced AI assistant with a sophisticated British personality. "
+        "You are helpful, efficient, and polite. Always address the user as 'sir' or 'madam' as appropriate. "
+        "Provide concise but comprehensive responses. You have access to various systems and can help with "
+        "information queries, system operations, and general assistance."
+    )
+    
     def __init__(self, root):
+        load_tkinter()
         self.root = root
         self.setup_window()
         
@@ -652,8 +1532,42 @@ class EnhancedJarvisAssistant:
         self.command_processor = SmartCommandProcessor()
         self.init_database()
         
+        # Component availability is fixed from here on, so describe it once
+        self._capabilities_text, self._status_components_text = self._describe_components()
+        
+        # Command type -> handler(command, extracted_data)
+        self._command_handlers = {
+            'time': lambda command, data: self.handle_time_command(),
+            'date': lambda command, data: self.handle_date_command(),
+            'weather': lambda command, data: self.handle_weather_command(command),
+            'search': lambda command, data: self.handle_search_command(
+                self.command_processor.extract_search_query(command, data)
+            ),
+            'open_website': self._open_website_command,
+            'greeting': lambda command, data: self.handle_greeting(),
+            'thanks': lambda command, data: self.handle_thanks(),
+            'status': lambda command, data: self.handle_status_query(),
+            'clear': lambda command, data: self.handle_clear_screen(),
+        }
+        
+        # Canned replies in shuffled rotation
+        self._response_cycles = {
+            name: itertools.cycle(random.sample(responses, len(responses)))
+            for name, responses in (
+                ("greeting", GREETING_RESPONSES),
+                ("thanks", THANKS_RESPONSES),
+                ("status", STATUS_RESPONSES),
+                ("fallback", FALLBACK_RESPONSES),
+            )
+        }
+        
+        self._ollama_model = OLLAMA_MODEL  # Resolved on the first AI query when not configured
+        
+        # Shared workers for listening and AI queries
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='jarvis')
+        
         # State variables
-        self.conversation_history = []
+        self.conversation_history = collections.deque(maxlen=50)
         self.is_listening = False
         self.wake_word_listening = False
         self.system_status = "ONLINE"
@@ -661,29 +1575,42 @@ class EnhancedJarvisAssistant:
         # Create enhanced GUI
         self.create_gui()
         
-        # Message queue with priority
-        self.message_queue = queue.PriorityQueue()
-        self.process_message_queue()
+        # Message queue with priority: status notices (1) ahead of everything else
+        self._hi_q = collections.deque()
+        self._lo_q = collections.deque()
+        self._message_event_pending = False
+        self.root.bind("<<MessageReady>>", self._on_message_ready)
         
-        # Start with calibration and welcome
-        self.initialize_system()
+        # Start with calibration and welcome. The microphone test and calibration
+        # record for several seconds, so run them off the Tk thread and let the
+        # window paint and respond meanwhile. Workers may only post messages once
+        # mainloop is running, so hand the job over from the first idle callback.
+        self.root.after_idle(self._pool.submit, self.initialize_system)
     
     def initialize_system(self):
-        """Initialize system with proper setup"""
+        """Initialize system with proper setup (runs on the worker pool)"""
         # Test and calibrate microphone
         if self.speech_recognizer.available:
             success, message = self.speech_recognizer.test_microphone()
             if success:
-                self.add_message("SYSTEM", f"Microphone test passed. {message}", priority=1)
+                self.add_message(SENDER_SYSTEM, f"Microphone test passed. {message}", priority=1)
                 if self.speech_recognizer.calibrate():
-                    self.add_message("SYSTEM", "Microphone calibrated successfully.", priority=1)
+                    self.add_message(SENDER_SYSTEM, "Microphone calibrated successfully.", priority=1)
                 else:
-                    self.add_message("SYSTEM", "Microphone calibration failed.", priority=1)
+                    self.add_message(SENDER_SYSTEM, "Microphone calibration failed.", priority=1)
             else:
-                self.add_message("SYSTEM", f"Microphone test failed: {message}", priority=1)
+                self.add_message(SENDER_SYSTEM, f"Microphone test failed: {message}", priority=1)
         
         # Welcome message
         self.welcome_message()
+        
+        # Offline recognition model last; voice commands use Google until it is ready
+        if self.speech_recognizer.available and MODULES['faster_whisper']['available']:
+            self.add_message(SENDER_SYSTEM, "Loading offline speech recognition model...", priority=1)
+            if self.speech_recognizer.load_whisper():
+                self.add_message(SENDER_SYSTEM, "Offline speech recognition ready.", priority=1)
+            else:
+                self.add_message(SENDER_SYSTEM, "Offline speech recognition unavailable; using Google.", priority=1)
     
     def setup_window(self):
         """Enhanced window setup with better styling"""
@@ -737,11 +1664,22 @@ class EnhancedJarvisAssistant:
     
     def init_database(self):
         """Enhanced database initialization with better schema"""
+        self._db_q = queue.Queue()
+        self._db_thread = None
         try:
-            os.makedirs("data", exist_ok=True)
-            self.conn = sqlite3.connect("data/jarvis_enhanced.db", check_same_thread=False)
+            os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+            # Autocommit mode: the writer thread groups inserts with explicit BEGIN/COMMIT
+            self.conn = sqlite3.connect(
+                DATABASE_PATH, check_same_thread=False, isolation_level=None, cached_statements=256
+            )
             self.cursor = self.conn.cursor()
             
+            # WAL with NORMAL sync avoids an fsync on every commit
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+            self.cursor.execute("PRAGMA temp_store=MEMORY")
+            self.cursor.execute("PRAGMA mmap_size=67108864")
+            
             # Create enhanced schema
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS conversations (
@@ -755,6 +1693,10 @@ class EnhancedJarvisAssistant:
                 )
             ''')
             
+            self.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_conversations_timestamp ON conversations(timestamp)"
+            )
+            
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS system_logs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -766,6 +1708,10 @@ class EnhancedJarvisAssistant:
             ''')
             
             self.conn.commit()
+            
+            # Inserts happen on a writer thread so commits never stall the GUI
+            self._db_thread = threading.Thread(target=self._db_writer, name="jarvis-db", daemon=True)
+            self._db_thread.start()
             logger.info("Enhanced database initialized")
         except Exception as e:
             logger.error(f"Database init error: {e}")
@@ -886,38 +1832,24 @@ class EnhancedJarvisAssistant:
             selectbackground=COLORS['bg_light']
         )
         self.chat_area.grid(row=0, column=0, sticky="nsew")
-        self.chat_area.config(state=tk.DISABLED)
+        self.chat_area.config(state=tk.DISABLED, yscrollcommand=self._on_chat_scroll)
+        
+        # Every message lives in message_log; only a window of it is in the widget
+        self.message_log = collections.deque(maxlen=CHAT_LOG_SIZE)
+        self._log_base = 0  # Absolute index of message_log[0]
+        self._view_start = 0  # Absolute index range of the messages in chat_area
+        self._view_end = 0
+        self._view_lines = collections.deque()  # Line count of each rendered message
+        self._paging = False
+        self._stream_index = None  # Absolute index of the AI reply being streamed in
         
         # Configure enhanced text tags
         self.configure_chat_tags()
     
     def configure_chat_tags(self):
         """Configure enhanced text tags for better formatting"""
-        # Timestamp tags
-        self.chat_area.tag_config("timestamp", foreground=COLORS['text_secondary'], 
-                                font=FONTS['micro'])
-        
-        # Speaker tags
-        self.chat_area.tag_config("jarvis_sender", foreground=COLORS['accent'], 
-                                font=(FONTS['monospace'][0], FONTS['monospace'][1], 'bold'))
-        self.chat_area.tag_config("thinking_sender", foreground=COLORS['ai_thinking'], 
-                                font=(FONTS['monospace'][0], FONTS['monospace'][1], 'italic'))
-        self.chat_area.tag_config("user_sender", foreground=COLORS['success'], 
-                                font=(FONTS['monospace'][0], FONTS['monospace'][1], 'bold'))
-        self.chat_area.tag_config("voice_sender", foreground=COLORS['voice_active'], 
-                                font=(FONTS['monospace'][0], FONTS['monospace'][1], 'bold'))
-        self.chat_area.tag_config("system_sender", foreground=COLORS['warning'], 
-                                font=(FONTS['monospace'][0], FONTS['monospace'][1], 'bold'))
-        
-        # Message content tags
-        self.chat_area.tag_config("jarvis_message", foreground=COLORS['text_primary'])
-        self.chat_area.tag_config("user_message", foreground=COLORS['text_primary'])
-        self.chat_area.tag_config("system_message", foreground=COLORS['text_secondary'])
-        self.chat_area.tag_config("error_message", foreground=COLORS['error'])
-        
-        # Special formatting
-        self.chat_area.tag_config("highlight", background=COLORS['bg_light'], 
-                                foreground=COLORS['accent'])
+        for tag, options in CHAT_TAGS.items():
+            self.chat_area.tag_config(tag, **options)
     
     def create_input_area(self, parent):
         """Create enhanced input area with voice controls"""
@@ -971,7 +1903,7 @@ class EnhancedJarvisAssistant:
     def toggle_listening(self):
         """Enhanced listening toggle with visual feedback"""
         if not self.speech_recognizer.available:
-            self.add_message("SYSTEM", "Speech recognition is not available", priority=1)
+            self.add_message(SENDER_SYSTEM, "Speech recognition is not available", priority=1)
             return
             
         if self.is_listening:
@@ -987,10 +1919,10 @@ class EnhancedJarvisAssistant:
         self.status_indicator.config(text="● LISTENING", foreground=COLORS['listening'])
         
         # Add system message
-        self.add_message("SYSTEM", "Listening for your command...", priority=1)
+        self.add_message(SENDER_SYSTEM, "Listening for your command...", priority=1)
         
         # Start listening in a separate thread
-        threading.Thread(target=self.enhanced_listen_thread, daemon=True).start()
+        self._pool.submit(self.enhanced_listen_thread)
     
     def stop_listening(self):
         """Stop listening with proper cleanup"""
@@ -999,13 +1931,13 @@ class EnhancedJarvisAssistant:
         self.mic_btn.config(text="🎤")
         self.status_indicator.config(text="● ONLINE", foreground=COLORS['success'])
         
-        self.add_message("SYSTEM", "Stopped listening", priority=1)
+        self.add_message(SENDER_SYSTEM, "Stopped listening", priority=1)
     
     def stop_all_audio(self):
         """Stop all audio operations"""
         self.stop_listening()
         self.tts.stop_speaking()
-        self.add_message("SYSTEM", "All audio operations stopped", priority=1)
+        self.add_message(SENDER_SYSTEM, "All audio operations stopped", priority=1)
     
     def update_voice_indicator(self, state):
         """Update voice status indicator"""
@@ -1027,7 +1959,7 @@ class EnhancedJarvisAssistant:
         try:
             while self.is_listening:
                 # Update processing indicator
-                self.root.after(0, lambda: self.update_voice_indicator("processing"))
+                self.root.after(0, self.update_voice_indicator, "processing")
                 
                 # Listen for speech
                 text = self.speech_recognizer.listen(timeout=10, phrase_limit=10)
@@ -1039,19 +1971,18 @@ class EnhancedJarvisAssistant:
                 
                 if text is None:
                     # Timeout - continue listening
-                    self.root.after(0, lambda: self.update_voice_indicator("listening"))
+                    self.root.after(0, self.update_voice_indicator, "listening")
                     continue
                     
                 if text == "":
                     # Speech detected but not understood
-                    self.root.after(0, lambda: self.add_message("SYSTEM", 
-                        "I heard something but couldn't understand it. Please try again.", priority=1))
-                    self.root.after(0, lambda: self.update_voice_indicator("listening"))
+                    self.root.after(0, self.add_message, SENDER_SYSTEM,
+                        "I heard something but couldn't understand it. Please try again.", 1)
+                    self.root.after(0, self.update_voice_indicator, "listening")
                     continue
                 
                 # Process the recognized text
-                self.root.after(0, lambda t=text, pt=processing_time: 
-                              self.process_voice_input(t, pt))
+                self.root.after(0, self.process_voice_input, text, processing_time)
                 
                 # Stop listening after successful recognition (single command mode)
                 self.root.after(0, self.stop_listening)
@@ -1059,14 +1990,14 @@ class EnhancedJarvisAssistant:
                 
         except Exception as e:
             logger.error(f"Enhanced listen thread error: {e}")
-            self.root.after(0, lambda: self.add_message("SYSTEM", 
-                f"Speech recognition error: {str(e)}", priority=1))
+            self.root.after(0, self.add_message, SENDER_SYSTEM,
+                f"Speech recognition error: {str(e)}", 1)
             self.root.after(0, self.stop_listening)
     
     def process_voice_input(self, text, processing_time=0.0):
         """Process voice input with enhanced feedback"""
-        self.add_message("YOU (Voice)", text, priority=2)
-        self.save_conversation("YOU", text, "voice", processing_time=processing_time)
+        self.add_message(SENDER_YOU_VOICE, text, priority=2)
+        self.save_conversation(SENDER_YOU, text, "voice", processing_time=processing_time)
         
         # Show processing indicator
         self.update_voice_indicator("processing")
@@ -1086,8 +2017,8 @@ class EnhancedJarvisAssistant:
         if interrupt_speech:
             self.tts.stop_speaking()
         
-        self.add_message("YOU", text, priority=2)
-        self.save_conversation("YOU", text, "text")
+        self.add_message(SENDER_YOU, text, priority=2)
+        self.save_conversation(SENDER_YOU, text, "text")
         self.process_command(text)
         
         # Return focus to input
@@ -1100,67 +2031,73 @@ class EnhancedJarvisAssistant:
         # Classify the command
         command_type, extracted_data = self.command_processor.classify_command(command)
         
-        # Process based on command type
-        if command_type == 'time':
-            self.handle_time_command()
-        elif command_type == 'date':
-            self.handle_date_command()
-        elif command_type == 'weather':
-            self.handle_weather_command(command)
-        elif command_type == 'search':
-            query = self.command_processor.extract_search_query(command, extracted_data)
-            self.handle_search_command(query)
-        elif command_type == 'open_website':
-            if extracted_data:
-                site = extracted_data[0] if isinstance(extracted_data, tuple) else extracted_data
-                self.handle_open_website(site)
-        elif command_type == 'greeting':
-            self.handle_greeting()
-        elif command_type == 'thanks':
-            self.handle_thanks()
-        elif command_type == 'status':
-            self.handle_status_query()
-        elif command_type == 'clear':
-            self.handle_clear_screen()
+        # Process based on command type; general queries use AI or a helpful response
+        handler = self._command_handlers.get(command_type)
+        if handler:
+            handler(command, extracted_data)
         else:
-            # General query - use AI or provide helpful response
             self.handle_general_query(command)
         
         # Log processing time
         processing_time = time.time() - start_time
         logger.debug(f"Command processed in {processing_time:.2f}s")
     
+    def _run_background(self, func, *args, on_done=None, on_error=None):
+        """Run func on the worker pool and pass its result to on_done on the Tk thread
+        
+        If func raises, on_error is called on the Tk thread with the exception instead.
+        """
+        future = self._pool.submit(func, *args)
+        if on_done is not None or on_error is not None:
+            def deliver(done_future):
+                try:
+                    result = done_future.result()
+                except Exception as e:
+                    logger.error(f"Background task error: {e}")
+                    if on_error is not None:
+                        self.root.after(0, on_error, e)
+                    return
+                if on_done is not None:
+                    self.root.after(0, on_done, result)
+            future.add_done_callback(deliver)
+        return future
+    
+    def _open_website_command(self, command, extracted_data):
+        """Open the site named in an open_website command, if one was extracted"""
+        if extracted_data:
+            site = extracted_data[0] if isinstance(extracted_data, tuple) else extracted_data
+            self.handle_open_website(site)
+    
     def handle_time_command(self):
         """Handle time-related commands"""
-        current_time = datetime.now()
-        time_str = current_time.strftime("%I:%M %p")
-        date_str = current_time.strftime("%A, %B %d")
+        time_str = time.strftime("%I:%M %p")
+        date_str = _date_strings(date.today().toordinal())[0]
         
         response = f"The current time is {time_str} on {date_str}, sir."
         self.add_jarvis_response(response)
     
     def handle_date_command(self):
         """Handle date-related commands"""
-        current_date = datetime.now()
-        date_str = current_date.strftime("%A, %B %d, %Y")
+        date_str = _date_strings(date.today().toordinal())[1]
         
         response = f"Today is {date_str}, sir."
         self.add_jarvis_response(response)
     
     def handle_weather_command(self, command):
         """Handle weather-related commands"""
-        self.add_message("JARVIS", "Checking weather information...", priority=1)
+        self.add_message(SENDER_JARVIS, "Checking weather information...", priority=1)
         
         # Extract location if mentioned
-        location_match = re.search(r'\bin\s+(\w+(?:\s+\w+)*)', command.lower())
+        location_match = _WEATHER_LOCATION_RE.search(command)
         if location_match:
             location = location_match.group(1)
             query = f"weather in {location}"
         else:
             query = "current weather"
         
-        result = self.web_access.search_web(query)
-        self.add_jarvis_response(result)
+        self.web_access.search_web_async(
+            query, lambda result: self.root.after(0, self.add_jarvis_response, result)
+        )
     
     def handle_search_command(self, query):
         """Handle search commands with better feedback"""
@@ -1168,14 +2105,12 @@ class EnhancedJarvisAssistant:
             self.add_jarvis_response("I'm not sure what you'd like me to search for, sir.")
             return
         
-        self.add_message("JARVIS", f"Searching for information about '{query}'...", priority=1)
+        self.add_message(SENDER_JARVIS, f"Searching for information about '{query}'...", priority=1)
         
-        # Perform web search
-        def search_thread():
-            result = self.web_access.search_web(query)
-            self.root.after(0, lambda: self.add_jarvis_response(result))
-        
-        threading.Thread(target=search_thread, daemon=True).start()
+        # Perform web search off the Tk thread
+        self.web_access.search_web_async(
+            query, lambda result: self.root.after(0, self.add_jarvis_response, result)
+        )
     
     def handle_open_website(self, site):
         """Handle website opening commands"""
@@ -1183,76 +2118,65 @@ class EnhancedJarvisAssistant:
             self.add_jarvis_response("I'm not sure which website you'd like me to open, sir.")
             return
         
-        result = self.web_access.open_website(site)
-        self.add_jarvis_response(result)
+        # Launching a browser can block for a while, so keep it off the Tk thread
+        self._run_background(
+            self.web_access.open_website, site,
+            on_done=self.add_jarvis_response,
+            on_error=lambda e: self.add_jarvis_response(f"I couldn't open {site}, sir.")
+        )
     
     def handle_greeting(self):
         """Handle greeting commands with varied responses"""
-        current_hour = datetime.now().hour
-        
-        if 5 <= current_hour < 12:
-            time_greeting = "Good morning"
-        elif 12 <= current_hour < 17:
-            time_greeting = "Good afternoon"
-        elif 17 <= current_hour < 21:
-            time_greeting = "Good evening"
-        else:
-            time_greeting = "Good evening"
-        
-        greetings = [
-            f"{time_greeting}, sir. How may I assist you today?",
-            f"{time_greeting}. What can I do for you, sir?",
-            f"Hello, sir. {time_greeting}. How may I be of service?",
-            f"{time_greeting}, sir. I'm ready to help with whatever you need."
-        ]
-        
-        self.add_jarvis_response(random.choice(greetings))
+        response = next(self._response_cycles["greeting"])
+        self.add_jarvis_response(response.format(greeting=_time_greeting()))
     
     def handle_thanks(self):
         """Handle thank you responses"""
-        responses = [
-            "You're most welcome, sir.",
-            "Always a pleasure to assist, sir.",
-            "Happy to help, sir. Is there anything else?",
-            "At your service, sir.",
-            "My pleasure, sir. What else can I do for you?"
-        ]
-        
-        self.add_jarvis_response(random.choice(responses))
+        self.add_jarvis_response(next(self._response_cycles["thanks"]))
     
     def handle_status_query(self):
         """Handle status/how are you queries"""
-        # Generate system status
-        components = []
-        if self.tts.available:
-            components.append("voice synthesis online")
-        if self.speech_recognizer.available:
-            components.append("speech recognition active")
-        if self.web_access.available:
-            components.append("web access operational")
-        
-        if components:
-            status_text = ", ".join(components[:-1])
-            if len(components) > 1:
-                status_text += f", and {components[-1]}"
-            else:
-                status_text = components[0]
+        status_text = self._status_components_text
+        response = next(self._response_cycles["status"])
+        self.add_jarvis_response(
+            response.format(status=status_text, status_capitalized=status_text.capitalize())
+        )
+    
+    def _describe_components(self):
+        """Build the capability list for the welcome message and the status phrase"""
+        components = [
+            (self.tts.available, "Advanced voice synthesis", "Voice synthesis unavailable",
+             "voice synthesis online"),
+            (self.speech_recognizer.available, "Enhanced speech recognition", "Speech recognition unavailable",
+             "speech recognition active"),
+            (self.web_access.available, "Web access and search", "Web access unavailable",
+             "web access operational"),
+            (MODULES['ollama']['available'], "Local AI intelligence", "Local AI unavailable", None),
+        ]
+        
+        capabilities_text = "\n".join(
+            f"✓ {online}" if available else f"✗ {offline}"
+            for available, online, offline, _ in components
+        )
+        
+        active = [status for available, _, _, status in components if available and status]
+        if len(active) > 1:
+            status_text = ", ".join(active[:-1]) + f", and {active[-1]}"
+        elif active:
+            status_text = active[0]
         else:
             status_text = "basic systems operational"
         
-        responses = [
-            f"All systems are functioning optimally, sir. I have {status_text}.",
-            f"Operating at full capacity, sir. Currently running with {status_text}.",
-            f"Systems are running smoothly, sir. {status_text.capitalize()}.",
-        ]
-        
-        self.add_jarvis_response(random.choice(responses))
+        return capabilities_text, status_text
     
     def handle_clear_screen(self):
         """Handle screen clearing commands"""
-        self.chat_area.config(state=tk.NORMAL)
-        self.chat_area.delete(1.0, tk.END)
-        self.chat_area.config(state=tk.DISABLED)
+        # Keep log indices monotonic, and detach any reply still streaming so its
+        # remaining tokens are not appended to a message that replaces it
+        self._log_base += len(self.message_log)
+        self._stream_index = None
+        self.message_log.clear()
+        self._render_window(self._log_base, self._log_base)
         self.add_jarvis_response("Display cleared, sir.")
     
     def handle_general_query(self, query):
@@ -1262,201 +2186,363 @@ class EnhancedJarvisAssistant:
             self.handle_ai_query(query)
         else:
             # Provide helpful fallback responses
-            fallback_responses = [
-                "I understand you're asking about that topic, sir. Perhaps try a web search for more detailed information?",
-                "That's an interesting question, sir. I'd recommend searching the web for comprehensive information on that subject.",
-                "I'd be happy to help you find information about that, sir. Shall I perform a web search?",
-                "For detailed information on that topic, sir, I suggest we search the web together.",
-            ]
-            
-            response = random.choice(fallback_responses)
-            self.add_jarvis_response(response)
+            self.add_jarvis_response(next(self._response_cycles["fallback"]))
     
     def handle_ai_query(self, query):
         """Handle queries using local AI (Ollama)"""
-        self.add_message("JARVIS", "Processing your query with AI...", priority=1, thinking=True)
+        self.add_message(SENDER_JARVIS, "Processing your query with AI...", priority=1, thinking=True)
         self.update_voice_indicator("processing")
         
+        # Snapshot the last 3 messages here; the deque keeps changing on the GUI thread
+        history = self.conversation_history
+        recent = list(itertools.islice(history, max(0, len(history) - 3), None))
+        
         def ai_thread():
             try:
-                # Create context for AI
-                context = """You are JARVIS, an advanced AI assistant with a sophisticated British personality. 
-                You are helpful, efficient, and polite. Always address the user as 'sir' or 'madam' as appropriate.
-                Provide concise but comprehensive responses. You have access to various systems and can help with
-                information queries, system operations, and general assistance."""
-                
-                # Add conversation context
-                if self.conversation_history:
-                    context += "\n\nRecent conversation context:\n"
-                    for msg in self.conversation_history[-3:]:  # Last 3 messages for context
-                        context += f"{msg['speaker']}: {msg['message']}\n"
-                
-                response = ollama.chat(
-                    model='llama3',
-                    messages=[
-                        {'role': 'system', 'content': context},
-                        {'role': 'user', 'content': query}
-                    ]
-                )
+                # Show tokens as they arrive and speak each sentence once it is complete
+                reply = []
+                unspoken = ""
+                for token in self._generate_response_stream(query, recent):
+                    if not reply:
+                        self.root.after(0, self._begin_streamed_reply)
+                    reply.append(token)
+                    self.root.after(0, self._append_to_last_message, token)
+                    
+                    if not self.tts.available:
+                        continue
+                    sentences, unspoken = _split_streamed_sentences(unspoken + token)
+                    for sentence in sentences:
+                        if not self.tts.is_speaking():
+                            self.root.after(0, self.update_voice_indicator, "speaking")
+                        self.tts.speak(sentence)
                 
-                ai_response = response['message']['content']
+                ai_response = "".join(reply)
                 
                 # Update UI in main thread
-                self.root.after(0, lambda: self.add_jarvis_response(ai_response))
-                self.root.after(0, lambda: self.update_voice_indicator("idle"))
+                if reply:
+                    self.root.after(0, self._finish_streamed_reply, ai_response, unspoken)
+                else:
+                    self.root.after(0, self.add_jarvis_response, ai_response)
+                    self.root.after(0, self.update_voice_indicator, "idle")
                 
             except Exception as e:
                 logger.error(f"AI query error: {e}")
                 error_response = f"I encountered an error while processing your query, sir: {str(e)}"
-                self.root.after(0, lambda: self.add_jarvis_response(error_response))
-                self.root.after(0, lambda: self.update_voice_indicator("idle"))
+                self.root.after(0, self.add_jarvis_response, error_response)
+                self.root.after(0, self.update_voice_indicator, "idle")
         
-        threading.Thread(target=ai_thread, daemon=True).start()
+        self._pool.submit(ai_thread)
+    
+    def _resolve_ollama_model(self):
+        """Pick the local AI model once: the configured one, else the best installed llama3 build"""
+        if self._ollama_model is None:
+            model = OLLAMA_DEFAULT_MODEL
+            try:
+                installed = {entry.get('model') or entry.get('name') for entry in ollama.list()['models']}
+                if OLLAMA_PREFERRED_MODEL in installed:
+                    model = OLLAMA_PREFERRED_MODEL
+            except Exception as e:
+                logger.debug(f"Could not list Ollama models: {e}")
+            logger.info(f"Local AI model: {model}")
+            self._ollama_model = model
+        return self._ollama_model
+    
+    def _generate_response_stream(self, query, recent):
+        """Yield the local AI's reply to query as text chunks while it is generated"""
+        # Create context for AI, with recent messages as conversation context
+        context = self._AI_SYSTEM_PROMPT
+        if recent:
+            history_lines = "".join(f"{msg['speaker']}: {msg['message']}\n" for msg in recent)
+            context = f"{context}\n\nRecent conversation context:\n{history_lines}"
+        
+        stream = ollama.chat(
+            model=self._resolve_ollama_model(),
+            messages=[
+                {'role': 'system', 'content': context},
+                {'role': 'user', 'content': query}
+            ],
+            stream=True
+        )
+        for chunk in stream:
+            token = chunk['message']['content']
+            if token:
+                yield token
+    
+    def _begin_streamed_reply(self):
+        """Start an empty JARVIS message for a streamed reply to be appended to"""
+        # Show anything already queued first so the reply lands after it
+        self._on_message_ready()
+        self._log_messages([self._render_message(time.strftime("%H:%M:%S"), SENDER_JARVIS, "")])
+        self._stream_index = self._log_base + len(self.message_log) - 1
+    
+    def _append_to_last_message(self, text):
+        """Append streamed text to the JARVIS reply started by _begin_streamed_reply"""
+        index = self._stream_index
+        if index is None or index < self._log_base:
+            return
+        
+        time_segment, sender_segment, (body, tag) = self.message_log[index - self._log_base]
+        self.message_log[index - self._log_base] = (
+            time_segment, sender_segment, (f"{body[:-2]}{text}\n\n", tag)
+        )
+        
+        if not self._view_start <= index < self._view_end:
+            return
+        
+        following = self._view_end == self._log_base + len(self.message_log)
+        offset = index - self._view_start
+        if index == self._view_end - 1:
+            # Insert before the message's trailing blank line
+            position = "end-3c"
+        else:
+            # Other messages were posted after the reply started; insert at the end
+            # of the reply's last body line, found from the rendered line counts
+            line = sum(itertools.islice(self._view_lines, offset)) + self._view_lines[offset] - 1
+            position = f"{line}.end"
+        self.chat_area.config(state=tk.NORMAL)
+        self.chat_area.insert(position, text, tag)
+        self.chat_area.config(state=tk.DISABLED)
+        self._view_lines[offset] += text.count("\n")
+        
+        if following:
+            self.chat_area.see(tk.END)
+    
+    def _finish_streamed_reply(self, response, unspoken):
+        """Save a fully streamed reply and speak the part not spoken yet"""
+        self._stream_index = None
+        self.save_conversation(SENDER_JARVIS, response, "text")
+        
+        if self.tts.available and unspoken.strip():
+            self.update_voice_indicator("speaking")
+            self.tts.speak(
+                unspoken, on_complete=lambda: self.root.after(0, self.update_voice_indicator, "idle")
+            )
+        else:
+            self.update_voice_indicator("idle")
     
     def add_jarvis_response(self, response):
         """Add JARVIS response with enhanced TTS"""
-        self.add_message("JARVIS", response, priority=2)
-        self.save_conversation("JARVIS", response, "text")
+        self.add_message(SENDER_JARVIS, response, priority=2)
+        self.save_conversation(SENDER_JARVIS, response, "text")
         
         # Update voice indicator and speak
         self.update_voice_indicator("speaking")
         if self.tts.available:
-            self.tts.speak(response)
-            
             # Reset voice indicator after speaking
-            def reset_indicator():
-                time.sleep(1)  # Wait a bit to ensure speaking started
-                while self.tts.is_speaking():
-                    time.sleep(0.5)
-                self.root.after(0, lambda: self.update_voice_indicator("idle"))
-            
-            threading.Thread(target=reset_indicator, daemon=True).start()
+            self.tts.speak(
+                response, on_complete=lambda: self.root.after(0, self.update_voice_indicator, "idle")
+            )
     
     def add_message(self, sender, message, priority=3, thinking=False):
         """Add message to display queue with priority"""
-        timestamp = datetime.now()
-        self.message_queue.put((priority, timestamp, sender, message, thinking))
+        # deque.append is atomic, so worker threads can post without a lock
+        bucket = self._hi_q if priority <= 1 else self._lo_q
+        bucket.append((sender, message, thinking))
+        
+        # One pending event is enough, the handler drains everything queued
+        if not self._message_event_pending:
+            self._message_event_pending = True
+            try:
+                self.root.event_generate("<<MessageReady>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                # Window destroyed during shutdown, or no main loop yet; let the
+                # next message try again rather than blocking delivery for good
+                self._message_event_pending = False
     
-    def process_message_queue(self):
+    def _on_message_ready(self, event=None):
         """Enhanced message queue processing with priority"""
-        try:
+        # Clear the flag first so messages posted while draining raise a new event
+        self._message_event_pending = False
+        
+        # Drain everything queued so far and draw it in one widget update,
+        # formatting the shared timestamp once for the whole batch
+        batch = []
+        time_str = time.strftime("%H:%M:%S")
+        for bucket in (self._hi_q, self._lo_q):
             while True:
-                priority, timestamp, sender, message, thinking = self.message_queue.get_nowait()
-                
+                try:
+                    sender, message, thinking = bucket.popleft()
+                except IndexError:
+                    break
+                batch.append(self._render_message(time_str, sender, message, thinking))
+        
+        if batch:
+            self._log_messages(batch)
+    
+    def _render_message(self, time_str, sender, message, thinking=False):
+        """Format a message once into the (text, tag) segments shown in the chat area"""
+        sender_tag, message_tag = self._TAG_TABLE.get(sender, self._DEFAULT_TAGS)
+        if thinking:
+            sender_tag = "thinking_sender"
+        return (
+            (f"[{time_str}] ", "timestamp"),
+            (f"{sender}: ", sender_tag),
+            (f"{message}\n\n", message_tag)
+        )
+    
+    def _log_messages(self, batch):
+        """Add rendered messages to the log, and to the widget if the view is at the end"""
+        following = self._view_end == self._log_base + len(self.message_log)
+        for rendered in batch:
+            if len(self.message_log) == self.message_log.maxlen:
+                self._log_base += 1
+            self.message_log.append(rendered)
+        
+        if not following:
+            # The user is reading older messages; these show when they scroll down
+            return
+        
+        log_end = self._log_base + len(self.message_log)
+        if len(batch) >= CHAT_WINDOW_SIZE:
+            self._render_window(log_end - CHAT_WINDOW_SIZE, log_end)
+        else:
+            self._insert_messages(batch)
+            self._view_end = log_end
+            
+            # Keep the widget to a fixed window by dropping the oldest rendered messages
+            lines = 0
+            while self._view_end - self._view_start > CHAT_WINDOW_SIZE:
+                lines += self._view_lines.popleft()
+                self._view_start += 1
+            if lines:
                 self.chat_area.config(state=tk.NORMAL)
-                
-                # Format timestamp
-                time_str = timestamp.strftime("%H:%M:%S")
-                
-                # Add timestamp
-                self.chat_area.insert(tk.END, f"[{time_str}] ", "timestamp")
-                
-                # Add sender with appropriate styling
-                sender_tag = self.get_sender_tag(sender, thinking)
-                self.chat_area.insert(tk.END, f"{sender}: ", sender_tag)
-                
-                # Add message content
-                message_tag = self.get_message_tag(sender)
-                self.chat_area.insert(tk.END, f"{message}\n\n", message_tag)
-                
+                self.chat_area.delete("1.0", f"{lines + 1}.0")
                 self.chat_area.config(state=tk.DISABLED)
+        
+        self.chat_area.see(tk.END)
+    
+    def _insert_messages(self, messages):
+        """Append rendered messages to the end of the chat area in a single insert"""
+        chunks = []
+        for segments in messages:
+            line_count = 0
+            for text, tag in segments:
+                chunks.append(text)
+                chunks.append(tag)
+                line_count += text.count("\n")
+            self._view_lines.append(line_count)
+        
+        if chunks:
+            self.chat_area.config(state=tk.NORMAL)
+            self.chat_area.insert(tk.END, *chunks)
+            self.chat_area.config(state=tk.DISABLED)
+    
+    def _render_window(self, start, end):
+        """Replace the chat area contents with messages start..end of the log"""
+        self.chat_area.config(state=tk.NORMAL)
+        self.chat_area.delete("1.0", tk.END)
+        self.chat_area.config(state=tk.DISABLED)
+        self._view_lines.clear()
+        
+        self._insert_messages(itertools.islice(
+            self.message_log, start - self._log_base, end - self._log_base
+        ))
+        self._view_start, self._view_end = start, end
+    
+    def _on_chat_scroll(self, first, last):
+        """Scrollbar hook that pages older or newer messages in at the edges"""
+        self.chat_area.vbar.set(first, last)
+        if self._paging:
+            return
+        
+        log_end = self._log_base + len(self.message_log)
+        if float(first) <= 0.0 and self._view_start > self._log_base:
+            self._paging = True
+            self.root.after_idle(self._page_chat, -1)
+        elif float(last) >= 1.0 and self._view_end < log_end:
+            self._paging = True
+            self.root.after_idle(self._page_chat, 1)
+    
+    def _page_chat(self, direction):
+        """Shift the rendered window half a window back or forward through the log"""
+        try:
+            log_end = self._log_base + len(self.message_log)
+            step = CHAT_WINDOW_SIZE // 2
+            old_start, old_end = self._view_start, self._view_end
+            
+            if direction < 0:
+                start = max(self._log_base, old_start - step)
+                end = min(log_end, start + CHAT_WINDOW_SIZE)
+                anchor = old_start  # Keep the message that was at the top in view
+            else:
+                end = min(log_end, old_end + step)
+                start = max(self._log_base, end - CHAT_WINDOW_SIZE)
+                anchor = max(start, old_end - 1)
+            
+            self._render_window(start, end)
+            
+            line = sum(itertools.islice(self._view_lines, anchor - start)) + 1
+            self.chat_area.yview(f"{line}.0")
+            if direction > 0 and end == log_end:
                 self.chat_area.see(tk.END)
-                
-        except queue.Empty:
-            pass
         finally:
-            self.root.after(100, self.process_message_queue)
+            self.root.after_idle(self._end_paging)
     
-    def get_sender_tag(self, sender, thinking=False):
-        """Get appropriate tag for sender"""
-        if thinking:
-            return "thinking_sender"
-        elif sender == "JARVIS":
-            return "jarvis_sender"
-        elif sender.startswith("YOU"):
-            if "Voice" in sender:
-                return "voice_sender"
-            else:
-                return "user_sender"
-        else:
-            return "system_sender"
-    
-    def get_message_tag(self, sender):
-        """Get appropriate tag for message content"""
-        if sender == "JARVIS":
-            return "jarvis_message"
-        elif sender.startswith("YOU"):
-            return "user_message"
-        elif sender == "SYSTEM":
-            return "system_message"
-        else:
-            return "system_message"
+    def _end_paging(self):
+        """Re-enable paging once the scroll updates from a re-render have settled"""
+        self._paging = False
     
     def save_conversation(self, speaker, message, message_type="text", confidence=1.0, processing_time=0.0):
         """Enhanced conversation saving with metadata"""
-        if self.cursor:
-            try:
-                timestamp = datetime.now().isoformat()
-                self.cursor.execute(
-                    "INSERT INTO conversations (timestamp, speaker, message, message_type, confidence, processing_time) VALUES (?, ?, ?, ?, ?, ?)",
-                    (timestamp, speaker, message, message_type, confidence, processing_time)
-                )
-                self.conn.commit()
-            except Exception as e:
-                logger.error(f"Database save error: {e}")
+        now = datetime.now()
+        if self._db_thread:
+            self._db_q.put((now.isoformat(), speaker, message, message_type, confidence, processing_time))
         
         # Keep in memory with enhanced structure
         self.conversation_history.append({
             "speaker": speaker, 
             "message": message, 
-            "timestamp": datetime.now(),
+            "timestamp": now,
             "type": message_type
         })
-        
-        # Maintain reasonable history size
-        if len(self.conversation_history) > 50:
-            self.conversation_history.pop(0)
     
-    def welcome_message(self):
-        """Enhanced welcome message with system status"""
-        current_time = datetime.now()
-        if 5 <= current_time.hour < 12:
-            greeting = "Good morning"
-        elif 12 <= current_time.hour < 17:
-            greeting = "Good afternoon"
-        elif 17 <= current_time.hour < 21:
-            greeting = "Good evening"
-        else:
-            greeting = "Good evening"
-        
-        welcome_msg = f"{greeting}, sir. JARVIS Enhanced systems are now online.\n\n"
-        
-        # System capabilities report
-        capabilities = []
-        if self.tts.available:
-            capabilities.append("✓ Advanced voice synthesis")
-        else:
-            capabilities.append("✗ Voice synthesis unavailable")
+    def _db_writer(self):
+        """Write queued conversation rows, committing up to 64 per transaction"""
+        while True:
+            row = self._db_q.get()
+            if row is None:
+                break
             
-        if self.speech_recognizer.available:
-            capabilities.append("✓ Enhanced speech recognition")
-        else:
-            capabilities.append("✗ Speech recognition unavailable")
+            # Gather whatever else arrives within 100ms into the same transaction
+            rows = [row]
+            stop = False
+            deadline = time.monotonic() + 0.1
+            while len(rows) < 64:
+                try:
+                    row = self._db_q.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                    break
+                rows.append(row)
             
-        if self.web_access.available:
-            capabilities.append("✓ Web access and search")
-        else:
-            capabilities.append("✗ Web access unavailable")
+            try:
+                self.conn.execute("BEGIN")
+                try:
+                    self.conn.executemany(CONVERSATION_INSERT_SQL, rows)
+                    self.conn.execute("COMMIT")
+                except Exception:
+                    self.conn.execute("ROLLBACK")
+                    raise
+            except Exception as e:
+                logger.error(f"Database save error: {e}")
             
-        if MODULES['ollama']['available']:
-            capabilities.append("✓ Local AI intelligence")
-        else:
-            capabilities.append("✗ Local AI unavailable")
+            if stop:
+                break
+    
+    def welcome_message(self):
+        """Enhanced welcome message with system status"""
+        greeting = _time_greeting()
         
-        welcome_msg += "System Status:\n" + "\n".join(capabilities) + "\n\n"
-        welcome_msg += "I'm ready to assist you with information, web searches, system operations, and general inquiries. How may I help you today?"
+        welcome_msg = (
+            f"{greeting}, sir. JARVIS Enhanced systems are now online.\n\n"
+            f"System Status:\n{self._capabilities_text}\n\n"
+            "I'm ready to assist you with information, web searches, system operations, and general inquiries. "
+            "How may I help you today?"
+        )
         
-        self.add_message("JARVIS", welcome_msg, priority=1)
+        self.add_message(SENDER_JARVIS, welcome_msg, priority=1)
         
         # Speak welcome message
         if self.tts.available:
@@ -1475,8 +2561,21 @@ class EnhancedJarvisAssistant:
         if self.tts:
             self.tts.stop_speaking()
         
+        # Release the microphone stream
+        if self.speech_recognizer:
+            self.speech_recognizer.close()
+        
+        # Stop pending web searches and background work
+        if self.web_access:
+            self.web_access.close()
+        self._pool.shutdown(wait=False)
+        
         # Close database connection
         if hasattr(self, 'conn') and self.conn:
+            if self._db_thread:
+                # Let the writer finish what is queued before closing
+                self._db_q.put(None)
+                self._db_thread.join(timeout=5)
             self.conn.close()
         
         # Cleanup audio files
@@ -1488,60 +2587,201 @@ class EnhancedJarvisAssistant:
         
         self.root.quit()
 
-def main():
+# Separator line for console output
+_BANNER = "=" * 60
+
+# Optional modules imported in the background while the window comes up
+PREWARM_MODULES = ('speech_recognition', 'pyttsx3', 'requests', 'selectolax', 'bs4', 'wikipedia', 'ollama')
+
+def prewarm_modules():
+    """Import optional modules ahead of first use; LazyModule then finds them in sys.modules"""
+    for module_name in PREWARM_MODULES:
+        if MODULES[module_name]['available']:
+            try:
+                importlib.import_module(_PROBED_MODULES.get(module_name, module_name))
+            except Exception as e:
+                logger.debug(f"Prewarm of {module_name} failed: {e}")
+
+# Installation suggestions for missing modules
+_INSTALL_CMDS = {
+    'gtts': 'pip install gtts',
+    'piper': 'pip install piper-tts',
+    'pyttsx3': 'pip install pyttsx3',
+    'pygame': 'pip install pygame',
+    'speech_recognition': 'pip install SpeechRecognition pyaudio',
+    'requests': 'pip install requests',
+    'requests_cache': 'pip install requests-cache',
+    'bs4': 'pip install beautifulsoup4',
+    'selectolax': 'pip install selectolax',
+    'lxml': 'pip install lxml',
+    'wikipedia': 'pip install wikipedia',
+    'ollama': 'pip install ollama',
+    'pydub': 'pip install pydub',
+    'pyaudio': 'pip install pyaudio',
+    'vosk': 'pip install vosk',
+    'faster_whisper': 'pip install faster-whisper'
+}
+
+# Modules each feature needs: one module from every group, so alternative backends
+# (piper/pyttsx3/gTTS, selectolax/bs4) each satisfy their group
+FEATURE_MODULES = {
+    'Voice synthesis': [('pygame',), ('piper', 'pyttsx3', 'gtts')],
+    'Speech recognition': [('speech_recognition',), ('pyaudio',)],
+    'Web search': [('requests',)],
+    'Local AI': [('ollama',)],
+}
+
+def missing_features():
+    """Names of the features with no usable backend installed"""
+    return [
+        feature for feature, groups in FEATURE_MODULES.items()
+        if not all(any(MODULES[module]['available'] for module in group) for group in groups)
+    ]
+
+def exit_after_error():
+    """Exit with status 1, first waiting for Enter if a user is at the console to read the error"""
+    if sys.stdin is not None and sys.stdin.isatty():
+        input("Press Enter to exit...")
+    sys.exit(1)
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="JARVIS Enhanced AI Assistant")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="don't print the startup banner and module report")
+    parser.add_argument('--check-modules', action='store_true',
+                        help="report optional module status and exit (status 1 if a feature has no backend)")
+    parser.add_argument('--profile-imports', action='store_true',
+                        help="time the startup and prewarm imports with -X importtime and show the slowest")
+    return parser.parse_args(argv)
+
+def profile_imports(limit=10):
+    """Import this script, Tk and the prewarmed modules in a child interpreter under -X importtime
+    
+    Prints the modules with the highest self time, or the child's error output if it
+    failed, and returns the child's exit status.
+    """
+    # Load the script by path, so the profile works whatever the file is called
+    code = (
+        "import importlib.util, sys; "
+        f"spec = importlib.util.spec_from_file_location('jarvis', {os.path.abspath(__file__)!r}); "
+        "module = importlib.util.module_from_spec(spec); sys.modules['jarvis'] = module; "
+        "spec.loader.exec_module(module); module.load_tkinter(); module.prewarm_modules()"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE, text=True
+    )
+    
+    # Lines look like "import time:       412 |       1530 |   package.module"
+    timings = []
+    errors = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            errors.append(line)
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            timings.append((int(fields[0]), int(fields[1]), fields[2].strip()))
+    
+    if result.returncode != 0:
+        # A partial timing table would be misleading; show why the imports failed
+        print(f"Import profiling failed (exit status {result.returncode}):", file=sys.stderr)
+        print("\n".join(errors), file=sys.stderr)
+        return result.returncode
+    
+    timings.sort(reverse=True)
+    total_ms = sum(self_us for self_us, _, _ in timings) / 1000
+    print(f"Slowest imports ({len(timings)} modules, {total_ms:.0f} ms total):")
+    print(f"{'self ms':>9} {'cumul. ms':>10}  module")
+    for self_us, cumulative_us, name in timings[:limit]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:10.1f}  {name}")
+    return result.returncode
+
+def print_startup_report():
+    """Print the banner, module status and installation suggestions"""
+    print(_BANNER)
+    print("Starting JARVIS Enhanced AI Assistant...", flush=True)
+    print(_BANNER)
+    
+    # System information
+    print(f"Python version: {sys.version}")
+    print(f"Operating system: {os.name}")
+    
+    # Check module availability
+    print("\nModule Status:")
+    for module, info in MODULES.items():
+        status = "✓" if info['available'] else "✗"
+        module_version = get_module_version(module)
+        version = f" (v{module_version})" if module_version else ""
+        print(f"  {status} {module}{version}")
+    
+    # Installation suggestions for missing modules
+    missing_modules = {module for module, info in MODULES.items() if not info['available']}
+    if missing_modules:
+        print("\nTo enable additional features, install these packages:")
+        for module, command in _INSTALL_CMDS.items():
+            if module in missing_modules:
+                print(f"  {command}")
+        
+        if 'ollama' in missing_modules:
+            print("\nFor Local AI features:")
+            print("  1. Install Ollama from https://ollama.ai/")
+            print(f"  2. Run: ollama pull {OLLAMA_MODEL or OLLAMA_DEFAULT_MODEL}")
+
+def main(argv=None):
     """Enhanced main application entry point with better error handling"""
+    args = parse_args(argv)
+    setup_logging()
+    
+    if args.check_modules:
+        # Health-check mode: probe afresh rather than trusting the cache, and skip the GUI
+        logging.getLogger().setLevel(logging.DEBUG)
+        for module, available in _refresh_caps().items():
+            MODULES[module]['available'] = available
+        print_startup_report()
+        
+        # Alternative backends and extras are optional; fail only when a feature has none
+        missing = missing_features()
+        print("\nFeature Status:")
+        for feature in FEATURE_MODULES:
+            print(f"  {'✗' if feature in missing else '✓'} {feature}")
+        sys.exit(1 if missing else 0)
+    
+    if args.profile_imports:
+        sys.exit(profile_imports())
+    
     try:
-        print("=" * 60)
-        print("Starting JARVIS Enhanced AI Assistant...")
-        print("=" * 60)
-        
-        # System information
-        print(f"Python version: {sys.version}")
-        print(f"Operating system: {os.name}")
-        
-        # Check module availability
-        print("\nModule Status:")
-        for module, info in MODULES.items():
-            status = "✓" if info['available'] else "✗"
-            version = f" (v{info['version']})" if info['version'] else ""
-            print(f"  {status} {module}{version}")
-        
-        # Installation suggestions for missing modules
-        missing_modules = [module for module, info in MODULES.items() if not info['available']]
-        if missing_modules:
-            print("\nTo enable additional features, install these packages:")
-            installation_commands = {
-                'gtts': 'pip install gtts',
-                'pygame': 'pip install pygame',
-                'speech_recognition': 'pip install SpeechRecognition pyaudio',
-                'requests': 'pip install requests',
-                'bs4': 'pip install beautifulsoup4',
-                'wikipedia': 'pip install wikipedia',
-                'ollama': 'pip install ollama',
-                'pydub': 'pip install pydub',
-                'pyaudio': 'pip install pyaudio'
-            }
-            
-            for module in missing_modules:
-                if module in installation_commands:
-                    print(f"  {installation_commands[module]}")
-            
-            if 'ollama' in missing_modules:
-                print("\nFor Local AI features:")
-                print("  1. Install Ollama from https://ollama.ai/")
-                print("  2. Run: ollama pull llama3")
+        if not args.quiet:
+            print_startup_report()
         
-        print("\n" + "=" * 60)
-        print("Initializing GUI...")
+        missing = [module for module, info in MODULES.items() if not info['available']]
+        if missing:
+            logger.warning(f"Optional modules not available: {', '.join(missing)}")
         
-        # Start enhanced GUI
+        # Revalidate the cached module probe for the next start while the GUI boots
+        threading.Thread(target=_refresh_caps, name="jarvis-caps", daemon=True).start()
+        
+        # Check for required modules
+        try:
+            load_tkinter()
+        except ImportError as e:
+            logger.error(f"Tkinter not available: {e}")
+            exit_after_error()
+        
+        # Start enhanced GUI; paint the empty window before the assistant's heavier setup
         root = tk.Tk()
+        threading.Thread(target=prewarm_modules, name="jarvis-prewarm", daemon=True).start()
+        root.update_idletasks()
+        if not args.quiet:
+            print("\n" + _BANNER)
+            print("Initializing GUI...", flush=True)
         app = EnhancedJarvisAssistant(root)
         root.protocol("WM_DELETE_WINDOW", app.cleanup_and_exit)
         
-        print("JARVIS Enhanced GUI started successfully!")
-        print("Ready for operation.")
-        print("=" * 60)
+        if not args.quiet:
+            sys.stdout.write(f"JARVIS Enhanced GUI started successfully!\nReady for operation.\n{_BANNER}\n")
+            sys.stdout.flush()
         
         root.mainloop()
         
@@ -1549,18 +2789,18 @@ def main():
         print("\nShutdown requested by user.")
         logger.info("JARVIS shutdown requested by user")
     except Exception as e:
-        import traceback
-        error_msg = f"JARVIS Enhanced startup error: {e}\n\nFull traceback:\n{traceback.format_exc()}"
-        print(error_msg)
-        logger.error(error_msg)
+        # Written with its traceback to jarvis.log and, via the stream handler, the console
+        logger.exception(f"JARVIS Enhanced startup error: {e}")
         
         try:
+            from tkinter import messagebox
             messagebox.showerror("JARVIS Enhanced Error", 
                                f"Failed to start JARVIS Enhanced:\n\n{str(e)}\n\nCheck jarvis.log for details.")
-        except:
-            pass
+        except Exception:
+            # No usable Tk (not installed, no display); the logged error above stands
+            logger.debug("Startup error dialog could not be shown", exc_info=True)
         
-        input("Press Enter to exit...")
+        exit_after_error()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file